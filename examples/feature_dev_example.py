@@ -2,6 +2,7 @@
 Example: Generating a Feature Development Report
 """
 
+import textwrap
 from datetime import date, timedelta
 from pathlib import Path
 
@@ -10,12 +11,104 @@ from report_template import (
     ReportGenerator,
     ReportType,
 )
-from report_template.models import ActionPoint, Milestone, Priority, Status, Task, TeamMember
+from report_template.formatters.pdf import WEASYPRINT_AVAILABLE
+from report_template.models import (
+    ActionPoints,
+    Milestone,
+    OutputFormat,
+    Priority,
+    Status,
+    Task,
+    TeamMember,
+)
+
+# Day offsets used to build the sample timeline
+D2, D3, D4, D5, D7, D8, D10, D13, D14, D21 = (
+    timedelta(days=n) for n in (2, 3, 4, 5, 7, 8, 10, 13, 14, 21)
+)
+
+
+# Long-form report sections, normalized once at import time
+TECHNICAL_APPROACH = textwrap.dedent(
+    """
+We are using FastAPI for the backend framework with the following components:
+
+- **OAuth2 Library**: Authlib for OAuth2 client implementation
+- **Token Management**: JWT tokens with RS256 signing
+- **Session Storage**: Redis for distributed session management
+- **Database**: PostgreSQL for user data and OAuth credentials
+- **Security**: Argon2 for password hashing
+
+The authentication flow follows the OAuth2 Authorization Code Grant pattern.
+"""
+).strip()
+
+ARCHITECTURE_NOTES = textwrap.dedent(
+    """
+The system follows a microservices architecture:
+
+1. Auth Service: Handles OAuth flows and token generation
+2. User Service: Manages user profiles and permissions
+3. Session Service: Redis-based session management
+4. API Gateway: Routes requests and validates tokens
+
+All services communicate via REST APIs with JWT authentication.
+"""
+).strip()
+
+TESTING_STRATEGY = textwrap.dedent(
+    """
+Comprehensive testing approach:
+
+1. **Unit Tests**: 80%+ coverage for all authentication logic
+2. **Integration Tests**: Test OAuth flows with mock providers
+3. **Security Tests**: SQL injection, XSS, CSRF protection
+4. **Load Tests**: 1000 concurrent users authentication
+5. **E2E Tests**: Complete user registration and login flows
+
+Using pytest, pytest-asyncio, and locust for load testing.
+"""
+).strip()
+
+DEPLOYMENT_PLAN = textwrap.dedent(
+    """
+Phased rollout strategy:
+
+1. **Week 1**: Deploy to development environment
+2. **Week 2**: Internal beta testing with team
+3. **Week 3**: Deploy to staging, QA validation
+4. **Week 4**: Production deployment with feature flag
+5. **Week 5**: Gradual rollout (10% -> 50% -> 100%)
+
+Rollback plan: Feature flag can instantly disable new auth system.
+"""
+).strip()
+
+PROGRESS_NOTES = textwrap.dedent(
+    """
+**Week 1 Progress:**
+- Completed database schema design
+- Set up development OAuth apps with Google
+- Initial implementation of OAuth flow in progress
+- Redis integration 80% complete
+
+**Blockers:**
+- Waiting for OAuth app approval from Microsoft (submitted 3 days ago)
+
+**Next Week:**
+- Complete Google OAuth integration
+- Start GitHub provider integration
+- Begin rate limiting implementation
+"""
+).strip()
 
 
 def main():
     """Generate a sample feature development report."""
 
+    # Use a single "now" so every date in the report shares the same reference point
+    today = date.today()
+
     # Create report data
     report = FeatureDevReport(
         title="User Authentication Feature - Development Report",
@@ -46,27 +139,8 @@ def main():
             "Session timeout after 30 minutes of inactivity",
             "All authentication endpoints must use HTTPS",
         ],
-        technical_approach="""
-We are using FastAPI for the backend framework with the following components:
-
-- **OAuth2 Library**: Authlib for OAuth2 client implementation
-- **Token Management**: JWT tokens with RS256 signing
-- **Session Storage**: Redis for distributed session management
-- **Database**: PostgreSQL for user data and OAuth credentials
-- **Security**: Argon2 for password hashing
-
-The authentication flow follows the OAuth2 Authorization Code Grant pattern.
-        """,
-        architecture_notes="""
-The system follows a microservices architecture:
-
-1. Auth Service: Handles OAuth flows and token generation
-2. User Service: Manages user profiles and permissions
-3. Session Service: Redis-based session management
-4. API Gateway: Routes requests and validates tokens
-
-All services communicate via REST APIs with JWT authentication.
-        """,
+        technical_approach=TECHNICAL_APPROACH,
+        architecture_notes=ARCHITECTURE_NOTES,
         tasks=[
             Task(
                 title="Design OAuth2 flow and database schema",
@@ -74,8 +148,8 @@ All services communicate via REST APIs with JWT authentication.
                 status=Status.COMPLETED,
                 priority=Priority.HIGH,
                 jira_id="AUTH-101",
-                target_start_date=date.today() - timedelta(days=10),
-                target_end_date=date.today() - timedelta(days=5),
+                target_start_date=today - D10,
+                target_end_date=today - D5,
             ),
             Task(
                 title="Implement OAuth2 provider integrations",
@@ -83,9 +157,9 @@ All services communicate via REST APIs with JWT authentication.
                 status=Status.IN_PROGRESS,
                 priority=Priority.HIGH,
                 jira_id="AUTH-102",
-                target_start_date=date.today() - timedelta(days=3),
-                target_end_date=date.today() + timedelta(days=4),
-                due_date=date.today() + timedelta(days=7),
+                target_start_date=today - D3,
+                target_end_date=today + D4,
+                due_date=today + D7,
             ),
             Task(
                 title="Set up Redis session management",
@@ -93,9 +167,9 @@ All services communicate via REST APIs with JWT authentication.
                 status=Status.IN_PROGRESS,
                 priority=Priority.MEDIUM,
                 jira_id="AUTH-103",
-                target_start_date=date.today() - timedelta(days=2),
-                target_end_date=date.today() + timedelta(days=3),
-                due_date=date.today() + timedelta(days=5),
+                target_start_date=today - D2,
+                target_end_date=today + D3,
+                due_date=today + D5,
             ),
             Task(
                 title="Implement rate limiting middleware",
@@ -103,9 +177,9 @@ All services communicate via REST APIs with JWT authentication.
                 status=Status.NOT_STARTED,
                 priority=Priority.MEDIUM,
                 jira_id="AUTH-104",
-                target_start_date=date.today() + timedelta(days=3),
-                target_end_date=date.today() + timedelta(days=8),
-                due_date=date.today() + timedelta(days=10),
+                target_start_date=today + D3,
+                target_end_date=today + D8,
+                due_date=today + D10,
             ),
             Task(
                 title="Security audit and penetration testing",
@@ -113,77 +187,60 @@ All services communicate via REST APIs with JWT authentication.
                 status=Status.NOT_STARTED,
                 priority=Priority.CRITICAL,
                 jira_id="AUTH-105",
-                target_start_date=date.today() + timedelta(days=10),
-                target_end_date=date.today() + timedelta(days=13),
-                due_date=date.today() + timedelta(days=14),
+                target_start_date=today + D10,
+                target_end_date=today + D13,
+                due_date=today + D14,
             ),
         ],
         milestones=[
             Milestone(
                 name="MVP - Basic OAuth Flow",
-                target_date=date.today() + timedelta(days=7),
+                target_date=today + D7,
                 status=Status.IN_PROGRESS,
                 completion_percentage=75,
                 description="Basic OAuth2 authentication with Google provider",
             ),
             Milestone(
                 name="Multi-Provider Support",
-                target_date=date.today() + timedelta(days=14),
+                target_date=today + D14,
                 status=Status.NOT_STARTED,
                 completion_percentage=0,
                 description="Support for GitHub and Microsoft OAuth providers",
             ),
             Milestone(
                 name="Production Ready",
-                target_date=date.today() + timedelta(days=21),
+                target_date=today + D21,
                 status=Status.NOT_STARTED,
                 completion_percentage=0,
                 description="Security audit complete, all tests passing, documentation done",
             ),
         ],
-        testing_strategy="""
-Comprehensive testing approach:
-
-1. **Unit Tests**: 80%+ coverage for all authentication logic
-2. **Integration Tests**: Test OAuth flows with mock providers
-3. **Security Tests**: SQL injection, XSS, CSRF protection
-4. **Load Tests**: 1000 concurrent users authentication
-5. **E2E Tests**: Complete user registration and login flows
-
-Using pytest, pytest-asyncio, and locust for load testing.
-        """,
-        deployment_plan="""
-Phased rollout strategy:
-
-1. **Week 1**: Deploy to development environment
-2. **Week 2**: Internal beta testing with team
-3. **Week 3**: Deploy to staging, QA validation
-4. **Week 4**: Production deployment with feature flag
-5. **Week 5**: Gradual rollout (10% -> 50% -> 100%)
-
-Rollback plan: Feature flag can instantly disable new auth system.
-        """,
-        action_points=[
-            ActionPoint(
+        testing_strategy=TESTING_STRATEGY,
+        deployment_plan=DEPLOYMENT_PLAN,
+        action_point=[
+            ActionPoints(
                 description="Complete security audit of authentication flow",
-                priority=Priority.CRITICAL,
+                impact=Priority.CRITICAL,
+                ap_priority=Priority.CRITICAL,
                 status=Status.IN_PROGRESS,
                 owner="Bob Johnson",
-                due_date=date.today() + timedelta(days=7),
+                due_date=today + D7,
             ),
-            ActionPoint(
+            ActionPoints(
                 description="Set up Redis cluster with replication for production",
-                priority=Priority.HIGH,
+                impact=Priority.HIGH,
+                ap_priority=Priority.HIGH,
                 status=Status.NOT_STARTED,
                 owner="DevOps Team",
-                due_date=date.today() + timedelta(days=14),
+                due_date=today + D14,
             ),
-            ActionPoint(
+            ActionPoints(
                 description="Implement monitoring for OAuth provider status",
-                priority=Priority.MEDIUM,
+                impact=Priority.MEDIUM,
+                ap_priority=Priority.MEDIUM,
                 status=Status.NOT_STARTED,
                 owner="John Doe",
-                due_date=date.today() + timedelta(days=21),
+                due_date=today + D21,
             ),
         ],
         dependencies=[
@@ -192,21 +249,7 @@ Rollback plan: Feature flag can instantly disable new auth system.
             "OAuth app registration with Google, GitHub, Microsoft",
             "Database migration for user schema changes",
         ],
-        progress_notes="""
-**Week 1 Progress:**
-- Completed database schema design
-- Set up development OAuth apps with Google
-- Initial implementation of OAuth flow in progress
-- Redis integration 80% complete
-
-**Blockers:**
-- Waiting for OAuth app approval from Microsoft (submitted 3 days ago)
-
-**Next Week:**
-- Complete Google OAuth integration
-- Start GitHub provider integration
-- Begin rate limiting implementation
-        """,
+        progress_notes=PROGRESS_NOTES,
     )
 
     # Initialize generator
@@ -218,25 +261,33 @@ Rollback plan: Feature flag can instantly disable new auth system.
 
     print("Generating reports...")
 
-    # Markdown
     md_path = generator.generate_to_file(
         report, ReportType.FEATURE_DEV, output_dir / "feature_dev_report.md"
     )
     print(f"✓ Markdown report: {md_path}")
 
-    # HTML
-    html_path = generator.generate_to_file(
-        report, ReportType.FEATURE_DEV, output_dir / "feature_dev_report.html"
-    )
+    # The HTML is rendered once and used both for the HTML report and as the
+    # input of the PDF conversion
+    html_content = generator.generate(report, ReportType.FEATURE_DEV, OutputFormat.HTML)
+
+    # PDF (requires weasyprint) is converted in a worker process while the
+    # HTML report is written
+    pdf_future = None
+    if WEASYPRINT_AVAILABLE:
+        pdf_future = generator.html_to_pdf_async(
+            html_content, output_dir / "feature_dev_report.pdf"
+        )
+
+    html_path = output_dir / "feature_dev_report.html"
+    html_path.write_bytes(html_content.encode("utf-8"))
     print(f"✓ HTML report: {html_path}")
 
-    # PDF (requires weasyprint)
     try:
-        pdf_path = generator.generate_to_file(
-            report, ReportType.FEATURE_DEV, output_dir / "feature_dev_report.pdf"
-        )
-        print(f"✓ PDF report: {pdf_path}")
-    except ImportError:
+        if pdf_future is None:
+            raise ImportError("weasyprint is not installed")
+        print(f"✓ PDF report: {pdf_future.result()}")
+    except (ImportError, OSError):
+        # WeasyPrint is missing, or installed without its system libraries (pango)
         print("⚠ PDF generation skipped (install weasyprint to enable)")
 
     print("\nReports generated successfully!")
@@ -5,16 +5,19 @@ This package provides tools for creating consistent documentation across feature
 program management, and engineering initiatives.
 """
 
+from typing import TYPE_CHECKING, Any, List
+
 __version__ = "0.1.0"
 
-from report_template.generator import ReportGenerator
-from report_template.models import (
-    ReportType,
-    ReportData,
-    FeatureDevReport,
-    ProgramMgmtReport,
-    EngineeringInitReport,
-)
+if TYPE_CHECKING:
+    from report_template.generator import ReportGenerator
+    from report_template.enums import ReportType
+    from report_template.models import (
+        ReportData,
+        FeatureDevReport,
+        ProgramMgmtReport,
+        EngineeringInitReport,
+    )
 
 __all__ = [
     "ReportGenerator",
@@ -24,3 +27,32 @@ __all__ = [
     "ProgramMgmtReport",
     "EngineeringInitReport",
 ]
+
+# Public names and the submodule that defines them. Submodules are imported on
+# first attribute access (PEP 562) so that importing the package stays cheap.
+_LAZY_ATTRIBUTES = {
+    "ReportGenerator": "report_template.generator",
+    "ReportType": "report_template.enums",
+    "ReportData": "report_template.models",
+    "FeatureDevReport": "report_template.models",
+    "ProgramMgmtReport": "report_template.models",
+    "EngineeringInitReport": "report_template.models",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import public classes from their submodules on first access."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """Include lazily imported names in dir() output."""
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,53 @@
+"""
+JSON helpers that use orjson when it is installed and fall back to the standard library.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse a JSON document.
+
+    Args:
+        data: JSON text or UTF-8 encoded bytes.
+
+    Returns:
+        Parsed Python object.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False, sort_keys: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON.
+
+    Values JSON can't represent (such as dates) are converted with str().
+
+    Args:
+        obj: Python object to serialize.
+        indent: If True, pretty-print with two-space indentation.
+        sort_keys: If True, sort dictionary keys.
+
+    Returns:
+        JSON document as bytes.
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=str, option=option)
+    return json.dumps(
+        obj, indent=2 if indent else None, sort_keys=sort_keys, default=str, ensure_ascii=False
+    ).encode("utf-8")
@@ -0,0 +1,55 @@
+"""
+YAML helpers that use the libyaml C bindings when PyYAML was built with them.
+"""
+
+from typing import IO, Any
+
+import yaml
+from yaml import YAMLError
+
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+    LIBYAML_AVAILABLE = True
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+    LIBYAML_AVAILABLE = False
+
+# YAMLError is re-exported so callers can catch parse errors without importing yaml
+__all__ = [
+    "LIBYAML_AVAILABLE",
+    "YAMLError",
+    "safe_load",
+    "safe_dump",
+]
+
+
+def safe_load(stream: Any) -> Any:
+    """
+    Parse a YAML document using the safe loader.
+
+    Args:
+        stream: YAML text, UTF-8 encoded bytes or an open file.
+
+    Returns:
+        Parsed Python object.
+    """
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def safe_dump(data: Any, stream: IO[str], **kwargs: Any) -> None:
+    """
+    Write data as block-style YAML using the safe dumper, keeping key order.
+
+    Non-ASCII text is written as-is and long strings are not folded across lines.
+
+    Args:
+        data: Python object to serialize.
+        stream: Open text file to write to.
+        **kwargs: Extra options passed to yaml.dump().
+    """
+    kwargs.setdefault("default_flow_style", False)
+    kwargs.setdefault("sort_keys", False)
+    kwargs.setdefault("allow_unicode", True)
+    kwargs.setdefault("width", 1_000_000)
+    yaml.dump(data, stream, Dumper=SafeDumper, **kwargs)
@@ -2,22 +2,194 @@
 Command-line interface for report generation.
 """
 
-import json
-import sys
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional
 
 import click
-import yaml
-
-from report_template.generator import ReportGenerator
-from report_template.models import (
-    EngineeringInitReport,
-    FeatureDevReport,
-    OutputFormat,
-    ProgramMgmtReport,
-    ReportType,
-)
+
+# Only the dependency-free enums are imported up front; YAML, Pydantic and
+# Jinja2 are imported inside the commands that use them so that --help and
+# unrelated commands start quickly.
+from report_template.enums import OutputFormat, ReportType
+
+# Option choices, computed once and shared by every command
+_REPORT_TYPE_CHOICES = tuple(t.value for t in ReportType)
+_OUTPUT_FORMAT_CHOICES = tuple(f.value for f in OutputFormat)
+_DATA_FORMAT_CHOICES = ("yaml", "json")
+
+# Shared option types, built once instead of per decorated command
+_REPORT_CHOICE = click.Choice(_REPORT_TYPE_CHOICES)
+_OUTPUT_FORMAT_CHOICE = click.Choice(_OUTPUT_FORMAT_CHOICES)
+_DATA_FORMAT_CHOICE = click.Choice(_DATA_FORMAT_CHOICES)
+
+# Buffer size for files written by the CLI. Reports can be several MB and a larger
+# buffer cuts the number of write syscalls compared to the 8 KiB default. Input
+# files are read whole with Path.read_bytes().
+_IO_BUF = 1 << 18
+
+
+def _default_cache_dir() -> Optional[str]:
+    """
+    Directory where compiled Jinja2 templates are cached between runs.
+
+    Resolved when a command runs rather than at import. Returns None (no cache)
+    if there is no cache home and the home directory can't be determined.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    if not cache_home:
+        try:
+            cache_home = str(Path.home() / ".cache")
+        except (KeyError, RuntimeError):
+            return None
+    return str(Path(cache_home) / "report-template" / "jinja")
+
+
+# Upper bound on concurrent JIRA requests made by fetch-tickets
+_MAX_JIRA_WORKERS = 16
+
+# Data file formats by file suffix
+_DATA_FORMATS = {".yaml": "yaml", ".yml": "yaml", ".json": "json"}
+
+
+def _load_yaml(raw: bytes) -> Any:
+    from report_template import _yaml
+
+    try:
+        return _yaml.safe_load(raw)
+    except _yaml.YAMLError as e:
+        raise click.ClickException(str(e)) from e
+
+
+def _load_json(raw: bytes) -> Any:
+    from report_template import _json
+
+    return _json.loads(raw)
+
+
+def _save_yaml(data: Any, path: Path) -> None:
+    from report_template import _yaml
+
+    with open(path, "w", encoding="utf-8", buffering=_IO_BUF) as f:
+        _yaml.safe_dump(data, f)
+
+
+def _save_json(data: Any, path: Path) -> None:
+    from report_template import _json
+
+    path.write_bytes(_json.dumps(data, indent=True))
+
+
+_LOADERS = {"yaml": _load_yaml, "json": _load_json}
+_SAVERS = {"yaml": _save_yaml, "json": _save_json}
+
+
+@lru_cache(maxsize=None)
+def _model_map() -> Dict[ReportType, Any]:
+    """Map report types to their Pydantic models, importing the models on first use."""
+    from report_template.models import (
+        EngineeringInitReport,
+        FeatureDevReport,
+        ProgramMgmtReport,
+    )
+
+    return {
+        ReportType.FEATURE_DEV: FeatureDevReport,
+        ReportType.PROGRAM_MGMT: ProgramMgmtReport,
+        ReportType.ENGINEERING_INIT: EngineeringInitReport,
+    }
+
+
+@lru_cache(maxsize=4)
+def _get_generator(templates_dir: Optional[str], cache_dir: Optional[str] = None) -> Any:
+    """
+    Get a ReportGenerator for the given templates directory, reusing earlier ones.
+
+    Commands invoked repeatedly in one process (e.g. through CliRunner) share the
+    Jinja2 environment and its compiled templates instead of building new ones.
+
+    Args:
+        templates_dir: Custom templates directory, or None for the bundled templates.
+        cache_dir: Directory for the compiled template cache, or None to disable it.
+
+    Returns:
+        ReportGenerator instance.
+    """
+    from report_template.generator import ReportGenerator
+
+    return ReportGenerator(
+        templates_dir=Path(templates_dir) if templates_dir else None,
+        bytecode_cache_dir=cache_dir,
+    )
+
+
+def _load_data(data_path: Path) -> Any:
+    """
+    Load a YAML or JSON data file, chosen by its suffix.
+
+    Raises:
+        click.ClickException: If the format is unsupported or the file can't be read or parsed.
+    """
+    data_format = _DATA_FORMATS.get(data_path.suffix)
+    if data_format is None:
+        raise click.ClickException(
+            f"Unsupported file format '{data_path.suffix}'. Use .yaml, .yml, or .json"
+        )
+
+    try:
+        return _LOADERS[data_format](data_path.read_bytes())
+    except (OSError, ValueError) as e:  # unreadable file or JSON parse error
+        raise click.ClickException(str(e)) from e
+
+
+def _load_report(data_path: Path, model_class: Any) -> Any:
+    """
+    Load a data file and validate it as the given report model.
+
+    JSON files are parsed and validated in one pass by Pydantic; YAML files are
+    parsed first and the resulting dict is validated.
+
+    Raises:
+        click.ClickException: If the file can't be read, parsed or validated.
+    """
+    if _DATA_FORMATS.get(data_path.suffix) == "json":
+        try:
+            raw = data_path.read_bytes()
+        except OSError as e:
+            raise click.ClickException(str(e)) from e
+        validate = model_class.model_validate_json
+    else:
+        raw = _load_data(data_path)
+        validate = model_class.model_validate
+
+    try:
+        return validate(raw)
+    except ValueError as e:  # pydantic.ValidationError
+        raise click.ClickException(str(e)) from e
+
+
+def _save_data(data: Any, output_path: Path, data_format: Optional[str] = None) -> None:
+    """
+    Write data as YAML or JSON.
+
+    Args:
+        data: Data to write.
+        output_path: Destination file.
+        data_format: "yaml" or "json". If None, YAML for .yaml/.yml files and JSON otherwise.
+
+    Raises:
+        click.ClickException: If the file can't be written.
+    """
+    if data_format is None:
+        data_format = _DATA_FORMATS.get(output_path.suffix, "json")
+
+    try:
+        _SAVERS[data_format](data, output_path)
+    except OSError as e:
+        raise click.ClickException(str(e)) from e
 
 
 @click.group()
@@ -38,7 +210,7 @@ def main() -> None:
     "-t",
     "--type",
     "report_type",
-    type=click.Choice([t.value for t in ReportType]),
+    type=_REPORT_CHOICE,
     required=True,
     help="Type of report to generate",
 )
@@ -53,7 +225,7 @@ def main() -> None:
     "-f",
     "--format",
     "output_format",
-    type=click.Choice([f.value for f in OutputFormat]),
+    type=_OUTPUT_FORMAT_CHOICE,
     default=None,
     help="Output format (auto-detected from file extension if not specified)",
 )
@@ -68,6 +240,15 @@ def main() -> None:
     default=None,
     help="Custom template name (overrides default)",
 )
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False),
+    default=_default_cache_dir,
+    envvar="REPORT_TEMPLATE_JINJA_CACHE",
+    show_default="$XDG_CACHE_HOME/report-template/jinja",
+    show_envvar=True,
+    help="Directory for cached compiled templates",
+)
 def generate(
     data_file: str,
     report_type: str,
@@ -75,6 +256,7 @@ def generate(
     output_format: Optional[str],
     template_dir: Optional[str],
     template: Optional[str],
+    cache_dir: Optional[str],
 ) -> None:
     """
     Generate a report from a data file.
@@ -99,41 +281,21 @@ def generate(
     # Use custom template (not applicable for DOCX)
     report-gen generate data.yaml -t feature_dev -o report.md --template my_template.md.j2
     """
-    try:
-        # Load data file
-        data_path = Path(data_file)
-        with open(data_path) as f:
-            if data_path.suffix in [".yaml", ".yml"]:
-                data = yaml.safe_load(f)
-            elif data_path.suffix == ".json":
-                data = json.load(f)
-            else:
-                click.echo(
-                    f"Error: Unsupported file format '{data_path.suffix}'. Use .yaml, .yml, or .json",
-                    err=True,
-                )
-                sys.exit(1)
-
-        # Validate data with appropriate model
-        report_type_enum = ReportType(report_type)
-        model_map = {
-            ReportType.FEATURE_DEV: FeatureDevReport,
-            ReportType.PROGRAM_MGMT: ProgramMgmtReport,
-            ReportType.ENGINEERING_INIT: EngineeringInitReport,
-        }
-
-        model_class = model_map[report_type_enum]
-        report_data = model_class(**data)
-
-        # Initialize generator
-        generator = ReportGenerator(
-            templates_dir=Path(template_dir) if template_dir else None
-        )
+    # Load and validate the data file with the model for this report type. The
+    # model's validator is built once when the class is defined and is reused here.
+    report_type_enum = ReportType(report_type)
+    model_class = _model_map()[report_type_enum]
+    report_data = _load_report(Path(data_file), model_class)
+
+    # Convert format string to enum if provided
+    format_enum = OutputFormat(output_format) if output_format else None
 
-        # Convert format string to enum if provided
-        format_enum = OutputFormat(output_format) if output_format else None
+    from jinja2 import TemplateError
 
-        # Generate report
+    # Generate report. Rendering can fail in several ways (missing or broken template,
+    # PDF backend missing, unwritable output), all reported the same way.
+    try:
+        generator = _get_generator(template_dir, cache_dir)
         output_path = generator.generate_to_file(
             report_data=report_data,
             report_type=report_type_enum,
@@ -141,12 +303,155 @@ def generate(
             output_format=format_enum,
             template_name=template,
         )
+    except (OSError, ImportError, ValueError, TemplateError) as e:
+        raise click.ClickException(str(e)) from e
+
+    click.echo(f"Report generated successfully: {output_path}")
+
+
+def _days_from(today: date, days: int) -> str:
+    """Format the date the given number of days from today as YYYY-MM-DD."""
+    return (today + timedelta(days=days)).isoformat()
+
+
+def _sample_feature_dev(today: date) -> Dict[str, Any]:
+    """Build sample feature development data with dates relative to today."""
+    return {
+        "title": "Feature Development Report",
+        "project_name": "My Project",
+        "author": "John Doe",
+        "feature_name": "User Authentication",
+        "repository": "https://github.com/org/repo",
+        "branch": "feature/auth",
+        "sprint": "Sprint 5",
+        "summary": "Implementation of user authentication system with OAuth2 support.",
+        "team_members": [
+            {"name": "John Doe", "role": "Lead Developer", "email": "john@example.com"},
+            {"name": "Jane Smith", "role": "Backend Developer", "email": "jane@example.com"},
+        ],
+        "objectives": [
+            "Implement secure user authentication",
+            "Support OAuth2 providers (Google, GitHub)",
+            "Add session management",
+        ],
+        "requirements": [
+            "Password must be at least 12 characters",
+            "Support multi-factor authentication",
+            "Implement rate limiting",
+        ],
+        "technical_approach": "Using FastAPI for backend, JWT for tokens, and Redis for session storage.",
+        "tasks": [
+            {
+                "title": "Design authentication flow",
+                "assignee": "John Doe",
+                "status": "Completed",
+                "priority": "High",
+                "jira_id": "AUTH-101",
+                "target_start_date": _days_from(today, -10),
+                "target_end_date": _days_from(today, -5),
+            },
+            {
+                "title": "Implement OAuth2 integration",
+                "assignee": "Jane Smith",
+                "status": "In Progress",
+                "priority": "High",
+                "jira_id": "AUTH-102",
+                "target_start_date": _days_from(today, -3),
+                "target_end_date": _days_from(today, 4),
+                "due_date": _days_from(today, 7),
+            },
+        ],
+        "testing_strategy": "Unit tests for auth logic, integration tests for OAuth flow, security testing.",
+        "deployment_plan": "Rolling deployment to staging, then production after QA approval.",
+        "action_points": [
+            {
+                "description": "Review security audit findings and implement recommendations",
+                "priority": "High",
+                "status": "In Progress",
+                "owner": "Security Team",
+                "due_date": _days_from(today, 7),
+            }
+        ],
+    }
+
+
+def _sample_program_mgmt(today: date) -> Dict[str, Any]:
+    """Build sample program management data with dates relative to today."""
+    return {
+        "title": "Program Management Report",
+        "project_name": "Digital Transformation Initiative",
+        "program_name": "Q4 2024 Platform Modernization",
+        "author": "Alice Johnson",
+        "reporting_period": "October 2024",
+        "status": "In Progress",
+        "summary": "Monthly update on platform modernization efforts.",
+        "executive_summary": "The platform modernization program is on track with 3 out of 5 milestones completed.",
+        "stakeholders": ["CTO", "VP Engineering", "Product Leadership"],
+        "budget_summary": "75% of allocated budget utilized, on track for completion within budget.",
+        "team_members": [
+            {"name": "Alice Johnson", "role": "Program Manager"},
+            {"name": "Bob Williams", "role": "Tech Lead"},
+        ],
+        "milestones": [
+            {
+                "name": "Phase 1: Assessment",
+                "target_date": _days_from(today, -60),
+                "status": "Completed",
+                "completion_percentage": 100,
+            }
+        ],
+        "key_achievements": [
+            "Completed infrastructure migration",
+            "Onboarded 5 new team members",
+        ],
+        "kpis": {
+            "System Uptime": "99.9%",
+            "Customer Satisfaction": "4.5/5",
+            "Deployment Frequency": "Daily",
+        },
+    }
+
 
-        click.echo(f"Report generated successfully: {output_path}")
+def _sample_engineering_init(today: date) -> Dict[str, Any]:
+    """Build sample engineering initiative data with dates relative to today."""
+    return {
+        "title": "Engineering Initiative Report",
+        "project_name": "Infrastructure Modernization",
+        "initiative_name": "Kubernetes Migration",
+        "initiative_type": "Infrastructure",
+        "author": "Charlie Brown",
+        "status": "In Progress",
+        "summary": "Migration of all services from EC2 to Kubernetes for better scalability.",
+        "sponsors": ["VP Engineering", "CTO"],
+        "team_members": [
+            {"name": "Charlie Brown", "role": "DevOps Lead"},
+            {"name": "Diana Prince", "role": "SRE"},
+        ],
+        "start_date": _days_from(today, -30),
+        "target_completion_date": _days_from(today, 90),
+        "objectives": [
+            "Migrate all production services to Kubernetes",
+            "Improve deployment automation",
+            "Reduce infrastructure costs by 30%",
+        ],
+        "scope": "Migration of 25 microservices to EKS, implementation of GitOps workflows.",
+        "technical_details": "Using EKS, ArgoCD for GitOps, Prometheus for monitoring.",
+        "success_criteria": [
+            "All services running on Kubernetes",
+            "Zero downtime during migration",
+            "30% cost reduction achieved",
+        ],
+        "impact_analysis": "Improved scalability, faster deployments, reduced operational overhead.",
+        "resources_required": "2 DevOps engineers, 1 SRE, AWS EKS clusters.",
+    }
 
-    except Exception as e:
-        click.echo(f"Error: {str(e)}", err=True)
-        sys.exit(1)
+
+# Sample data builders by report type; init builds only the requested one
+_SAMPLE_BUILDERS = {
+    ReportType.FEATURE_DEV: _sample_feature_dev,
+    ReportType.PROGRAM_MGMT: _sample_program_mgmt,
+    ReportType.ENGINEERING_INIT: _sample_engineering_init,
+}
 
 
 @main.command()
@@ -154,7 +459,7 @@ def generate(
     "-t",
     "--type",
     "report_type",
-    type=click.Choice([t.value for t in ReportType]),
+    type=_REPORT_CHOICE,
     required=True,
     help="Type of report template",
 )
@@ -169,7 +474,7 @@ def generate(
     "-f",
     "--format",
     "output_format",
-    type=click.Choice(["yaml", "json"]),
+    type=_DATA_FORMAT_CHOICE,
     default="yaml",
     help="Output format for sample data",
 )
@@ -190,152 +495,17 @@ def init(report_type: str, output: str, output_format: str) -> None:
     # Create sample program management data in JSON
     report-gen init -t program_mgmt -o my_program.json -f json
     """
-    from datetime import date, timedelta
-
-    # Sample data templates
-    samples = {
-        ReportType.FEATURE_DEV: {
-            "title": "Feature Development Report",
-            "project_name": "My Project",
-            "author": "John Doe",
-            "feature_name": "User Authentication",
-            "repository": "https://github.com/org/repo",
-            "branch": "feature/auth",
-            "sprint": "Sprint 5",
-            "summary": "Implementation of user authentication system with OAuth2 support.",
-            "team_members": [
-                {"name": "John Doe", "role": "Lead Developer", "email": "john@example.com"},
-                {"name": "Jane Smith", "role": "Backend Developer", "email": "jane@example.com"},
-            ],
-            "objectives": [
-                "Implement secure user authentication",
-                "Support OAuth2 providers (Google, GitHub)",
-                "Add session management",
-            ],
-            "requirements": [
-                "Password must be at least 12 characters",
-                "Support multi-factor authentication",
-                "Implement rate limiting",
-            ],
-            "technical_approach": "Using FastAPI for backend, JWT for tokens, and Redis for session storage.",
-            "tasks": [
-                {
-                    "title": "Design authentication flow",
-                    "assignee": "John Doe",
-                    "status": "Completed",
-                    "priority": "High",
-                    "jira_id": "AUTH-101",
-                    "target_start_date": str(date.today() - timedelta(days=10)),
-                    "target_end_date": str(date.today() - timedelta(days=5)),
-                },
-                {
-                    "title": "Implement OAuth2 integration",
-                    "assignee": "Jane Smith",
-                    "status": "In Progress",
-                    "priority": "High",
-                    "jira_id": "AUTH-102",
-                    "target_start_date": str(date.today() - timedelta(days=3)),
-                    "target_end_date": str(date.today() + timedelta(days=4)),
-                    "due_date": str(date.today() + timedelta(days=7)),
-                },
-            ],
-            "testing_strategy": "Unit tests for auth logic, integration tests for OAuth flow, security testing.",
-            "deployment_plan": "Rolling deployment to staging, then production after QA approval.",
-            "action_points": [
-                {
-                    "description": "Review security audit findings and implement recommendations",
-                    "priority": "High",
-                    "status": "In Progress",
-                    "owner": "Security Team",
-                    "due_date": str(date.today() + timedelta(days=7)),
-                }
-            ],
-        },
-        ReportType.PROGRAM_MGMT: {
-            "title": "Program Management Report",
-            "project_name": "Digital Transformation Initiative",
-            "program_name": "Q4 2024 Platform Modernization",
-            "author": "Alice Johnson",
-            "reporting_period": "October 2024",
-            "status": "In Progress",
-            "summary": "Monthly update on platform modernization efforts.",
-            "executive_summary": "The platform modernization program is on track with 3 out of 5 milestones completed.",
-            "stakeholders": ["CTO", "VP Engineering", "Product Leadership"],
-            "budget_summary": "75% of allocated budget utilized, on track for completion within budget.",
-            "team_members": [
-                {"name": "Alice Johnson", "role": "Program Manager"},
-                {"name": "Bob Williams", "role": "Tech Lead"},
-            ],
-            "milestones": [
-                {
-                    "name": "Phase 1: Assessment",
-                    "target_date": str(date.today() - timedelta(days=60)),
-                    "status": "Completed",
-                    "completion_percentage": 100,
-                }
-            ],
-            "key_achievements": [
-                "Completed infrastructure migration",
-                "Onboarded 5 new team members",
-            ],
-            "kpis": {
-                "System Uptime": "99.9%",
-                "Customer Satisfaction": "4.5/5",
-                "Deployment Frequency": "Daily",
-            },
-        },
-        ReportType.ENGINEERING_INIT: {
-            "title": "Engineering Initiative Report",
-            "project_name": "Infrastructure Modernization",
-            "initiative_name": "Kubernetes Migration",
-            "initiative_type": "Infrastructure",
-            "author": "Charlie Brown",
-            "status": "In Progress",
-            "summary": "Migration of all services from EC2 to Kubernetes for better scalability.",
-            "sponsors": ["VP Engineering", "CTO"],
-            "team_members": [
-                {"name": "Charlie Brown", "role": "DevOps Lead"},
-                {"name": "Diana Prince", "role": "SRE"},
-            ],
-            "start_date": str(date.today() - timedelta(days=30)),
-            "target_completion_date": str(date.today() + timedelta(days=90)),
-            "objectives": [
-                "Migrate all production services to Kubernetes",
-                "Improve deployment automation",
-                "Reduce infrastructure costs by 30%",
-            ],
-            "scope": "Migration of 25 microservices to EKS, implementation of GitOps workflows.",
-            "technical_details": "Using EKS, ArgoCD for GitOps, Prometheus for monitoring.",
-            "success_criteria": [
-                "All services running on Kubernetes",
-                "Zero downtime during migration",
-                "30% cost reduction achieved",
-            ],
-            "impact_analysis": "Improved scalability, faster deployments, reduced operational overhead.",
-            "resources_required": "2 DevOps engineers, 1 SRE, AWS EKS clusters.",
-        },
-    }
+    report_type_enum = ReportType(report_type)
+    sample_data = _SAMPLE_BUILDERS[report_type_enum](date.today())
 
-    try:
-        report_type_enum = ReportType(report_type)
-        sample_data = samples[report_type_enum]
+    output_path = Path(output)
 
-        output_path = Path(output)
+    # Write sample data
+    _save_data(sample_data, output_path, output_format)
 
-        # Write sample data
-        with open(output_path, "w") as f:
-            if output_format == "yaml":
-                yaml.dump(sample_data, f, default_flow_style=False, sort_keys=False)
-            else:
-                json.dump(sample_data, f, indent=2, default=str)
-
-        click.echo(f"Sample data file created: {output_path}")
-        click.echo(f"\nEdit this file with your data, then generate a report with:")
-        click.echo(f"  report-gen generate {output_path} -t {report_type} -o report.md")
-
-    except Exception as e:
-        click.echo(f"Error: {str(e)}", err=True)
-        sys.exit(1)
+    click.echo(f"Sample data file created: {output_path}")
+    click.echo(f"\nEdit this file with your data, then generate a report with:")
+    click.echo(f"  report-gen generate {output_path} -t {report_type} -o report.md")
 
 
 @main.command()
@@ -348,21 +518,60 @@ def init(report_type: str, output: str, output_format: str) -> None:
 def list_templates(template_dir: Optional[str]) -> None:
     """List available templates."""
     try:
-        generator = ReportGenerator(
-            templates_dir=Path(template_dir) if template_dir else None
-        )
+        generator = _get_generator(template_dir)
         templates = generator.list_templates()
+    except OSError as e:
+        raise click.ClickException(str(e)) from e
 
-        click.echo("Available templates:\n")
-        for report_type, template_list in templates.items():
-            click.echo(f"{report_type}:")
-            for template in template_list:
-                click.echo(f"  - {template}")
-            click.echo()
+    click.echo("Available templates:\n")
+    for report_type, template_list in templates.items():
+        click.echo(f"{report_type}:")
+        for template in template_list:
+            click.echo(f"  - {template}")
+        click.echo()
 
-    except Exception as e:
-        click.echo(f"Error: {str(e)}", err=True)
-        sys.exit(1)
+
+def _connect_jira(config: str) -> Any:
+    """
+    Load the JIRA config file and create a client.
+
+    Args:
+        config: Path to the JIRA YAML configuration file.
+
+    Returns:
+        Connected JiraClient.
+
+    Raises:
+        click.ClickException: If the client module, config file or connection fails.
+    """
+    from report_template import _yaml
+
+    try:
+        from report_template.jira_client import create_jira_client
+    except ImportError as e:
+        raise click.ClickException(
+            "JIRA integration not available. Install with: pip install atlassian-python-api"
+        ) from e
+
+    config_path = Path(config)
+    if not config_path.exists():
+        raise click.ClickException(
+            f"JIRA config file not found: {config_path}\n"
+            f"Create one from: .jira.config.example.yaml"
+        )
+
+    try:
+        jira_config = _yaml.safe_load(config_path.read_bytes()).get('jira', {})
+    except (OSError, AttributeError, _yaml.YAMLError) as e:
+        raise click.ClickException(f"Invalid JIRA config file {config_path}: {str(e)}") from e
+
+    try:
+        jira_client = create_jira_client(jira_config)
+    except ValueError as e:  # missing or invalid config keys
+        raise click.ClickException(f"Could not connect to JIRA: {str(e)}") from e
+
+    click.echo(f"✓ Connected to JIRA: {jira_config['url']}")
+    return jira_client
 
 
 @main.command()
@@ -414,71 +623,37 @@ def sync_jira(data_file: str, config: str, output: Optional[str]) -> None:
     # Use custom config file
     report-gen sync-jira feature_data.yaml --config ~/my-jira-config.yaml
     """
-    try:
-        from report_template.jira_client import create_jira_client
+    from report_template import _json
 
-        # Load JIRA config
-        config_path = Path(config)
-        if not config_path.exists():
-            click.echo(
-                f"Error: JIRA config file not found: {config_path}\n"
-                f"Create one from: .jira.config.example.yaml",
-                err=True
-            )
-            sys.exit(1)
+    jira_client = _connect_jira(config)
 
-        with open(config_path) as f:
-            jira_config = yaml.safe_load(f).get('jira', {})
+    # Load data file
+    data_path = Path(data_file)
+    data = _load_data(data_path)
 
-        # Create JIRA client
-        try:
-            jira_client = create_jira_client(jira_config)
-            click.echo(f"✓ Connected to JIRA: {jira_config['url']}")
-        except Exception as e:
-            click.echo(f"Error connecting to JIRA: {str(e)}", err=True)
-            sys.exit(1)
-
-        # Load data file
-        data_path = Path(data_file)
-        with open(data_path) as f:
-            if data_path.suffix in [".yaml", ".yml"]:
-                data = yaml.safe_load(f)
-            elif data_path.suffix == ".json":
-                data = json.load(f)
-            else:
-                click.echo(f"Error: Unsupported file format '{data_path.suffix}'", err=True)
-                sys.exit(1)
-
-        # Sync tasks
-        tasks = data.get('tasks', [])
-        if not tasks:
-            click.echo("No tasks found in data file.")
-            sys.exit(0)
-
-        click.echo(f"\nSyncing {len(tasks)} tasks...")
-        updated_tasks = jira_client.sync_tasks(tasks)
-        data['tasks'] = updated_tasks
-
-        # Save to output file
-        output_path = Path(output) if output else data_path
-        with open(output_path, 'w') as f:
-            if output_path.suffix in [".yaml", ".yml"]:
-                yaml.dump(data, f, default_flow_style=False, sort_keys=False)
-            else:
-                json.dump(data, f, indent=2, default=str)
+    # Sync tasks
+    tasks = data.get('tasks', [])
+    if not tasks:
+        click.echo("No tasks found in data file.")
+        return
 
-        click.echo(f"\n✓ Synced data saved to: {output_path}")
+    click.echo(f"\nSyncing {len(tasks)} tasks...")
+    # sync_tasks() updates the task dicts in place, so take a snapshot to compare.
+    # Serializing also makes dates read from YAML compare equal to JIRA's strings.
+    before = _json.dumps(tasks, sort_keys=True)
+    updated_tasks = jira_client.sync_tasks(tasks)
+    data['tasks'] = updated_tasks
 
-    except ImportError:
-        click.echo(
-            "Error: JIRA integration not available. "
-            "Install with: pip install atlassian-python-api",
-            err=True
-        )
-        sys.exit(1)
-    except Exception as e:
-        click.echo(f"Error: {str(e)}", err=True)
-        sys.exit(1)
+    # Nothing to write back if JIRA had no new data
+    if output is None and _json.dumps(updated_tasks, sort_keys=True) == before:
+        click.echo("\nNo changes.")
+        return
+
+    # Save to output file
+    output_path = Path(output) if output else data_path
+    _save_data(data, output_path)
+
+    click.echo(f"\n✓ Synced data saved to: {output_path}")
 
 
 @main.command()
@@ -517,80 +692,57 @@ def fetch_tickets(jira_ids: tuple, config: str, output: str) -> None:
     # Then generate the report
     report-gen generate feature_report.yaml -t feature_dev -o report.docx
     """
-    try:
-        from report_template.jira_client import create_jira_client
+    from report_template.jira_client import JiraError
 
-        # Load JIRA config
-        config_path = Path(config)
-        if not config_path.exists():
-            click.echo(
-                f"Error: JIRA config file not found: {config_path}\n"
-                f"Create one from: .jira.config.example.yaml",
-                err=True
-            )
-            sys.exit(1)
+    jira_client = _connect_jira(config)
 
-        with open(config_path) as f:
-            jira_config = yaml.safe_load(f).get('jira', {})
-
-        # Create JIRA client
+    # Fetch all tickets with bulk searches first
+    click.echo(f"\nFetching {len(jira_ids)} JIRA tickets...")
+    tasks = []
+    try:
+        issues = jira_client.get_issues_bulk(list(jira_ids))
+    except JiraError as e:
+        click.echo(f"Bulk fetch failed, fetching tickets individually: {str(e)}", err=True)
+        issues = {}
+
+    # Tickets the search didn't return are fetched one by one, concurrently, so
+    # that each failure gets its own error message. Results keep the order given.
+    def fetch(jira_id: str) -> Any:
         try:
-            jira_client = create_jira_client(jira_config)
-            click.echo(f"✓ Connected to JIRA: {jira_config['url']}")
-        except Exception as e:
-            click.echo(f"Error connecting to JIRA: {str(e)}", err=True)
-            sys.exit(1)
+            issue = issues.get(jira_id) or jira_client.get_issue(jira_id)
+            return jira_client.issue_to_task_data(issue)
+        except (JiraError, AttributeError) as e:  # AttributeError: null issue fields
+            return e
+
+    with ThreadPoolExecutor(max_workers=min(_MAX_JIRA_WORKERS, len(jira_ids))) as executor:
+        for jira_id, result in zip(jira_ids, executor.map(fetch, jira_ids)):
+            if isinstance(result, Exception):
+                click.echo(f"✗ Failed to fetch {jira_id}: {str(result)}", err=True)
+            else:
+                tasks.append(result)
+                click.echo(f"✓ Fetched {jira_id}: {result['title']}")
 
-        # Fetch each ticket
-        click.echo(f"\nFetching {len(jira_ids)} JIRA tickets...")
-        tasks = []
+    if not tasks:
+        raise click.ClickException("No tasks fetched successfully.")
 
-        for jira_id in jira_ids:
-            try:
-                issue = jira_client.get_issue(jira_id)
-                task_data = jira_client.issue_to_task_data(issue)
-                tasks.append(task_data)
-                click.echo(f"✓ Fetched {jira_id}: {task_data['title']}")
-            except Exception as e:
-                click.echo(f"✗ Failed to fetch {jira_id}: {str(e)}", err=True)
-
-        if not tasks:
-            click.echo("No tasks fetched successfully.")
-            sys.exit(1)
-
-        click.echo(f"\n✓ Successfully fetched {len(tasks)} tasks from JIRA")
-
-        # Create minimal data structure
-        data = {
-            'tasks': tasks,
-            'title': 'Report from JIRA',
-            'project_name': 'Project',
-            'author': 'Auto-generated',
-            'summary': f'Tasks fetched from JIRA tickets: {", ".join(jira_ids)}'
-        }
-
-        # Save to output file
-        output_path = Path(output)
-        with open(output_path, 'w') as f:
-            if output_path.suffix in [".yaml", ".yml"]:
-                yaml.dump(data, f, default_flow_style=False, sort_keys=False)
-            else:
-                json.dump(data, f, indent=2, default=str)
+    click.echo(f"\n✓ Successfully fetched {len(tasks)} tasks from JIRA")
 
-        click.echo(f"✓ Tasks saved to: {output_path}")
-        click.echo(f"\nYou can now generate a report with:")
-        click.echo(f"  report-gen generate {output_path} -t feature_dev -o report.docx")
+    # Create minimal data structure
+    data = {
+        'tasks': tasks,
+        'title': 'Report from JIRA',
+        'project_name': 'Project',
+        'author': 'Auto-generated',
+        'summary': f'Tasks fetched from JIRA tickets: {", ".join(jira_ids)}'
+    }
 
-    except ImportError:
-        click.echo(
-            "Error: JIRA integration not available. "
-            "Install with: pip install atlassian-python-api",
-            err=True
-        )
-        sys.exit(1)
-    except Exception as e:
-        click.echo(f"Error: {str(e)}", err=True)
-        sys.exit(1)
+    # Save to output file
+    output_path = Path(output)
+    _save_data(data, output_path)
+
+    click.echo(f"✓ Tasks saved to: {output_path}")
+    click.echo(f"\nYou can now generate a report with:")
+    click.echo(f"  report-gen generate {output_path} -t feature_dev -o report.docx")
 
 
 @main.command()
@@ -624,13 +776,20 @@ def fetch_tickets(jira_ids: tuple, config: str, output: str) -> None:
     is_flag=True,
     help="Save sanitized HTML to debug file for inspection",
 )
+@click.option(
+    "--gzip/--no-gzip",
+    "use_gzip",
+    default=False,
+    help="Gzip-compress the page upload (the server must accept Content-Encoding: gzip)",
+)
 def push_confluence(
     report_file: str,
     config: str,
     title: Optional[str],
     space: Optional[str],
     parent_id: Optional[str],
-    debug: bool
+    debug: bool,
+    use_gzip: bool,
 ) -> None:
     """
     Push a generated report to Confluence.
@@ -668,42 +827,57 @@ def push_confluence(
     # Debug mode - save sanitized HTML for inspection
     report-gen push-confluence report.html --debug
     """
+    from report_template import _json
+
     try:
-        from report_template.confluence_client import create_confluence_client
-
-        # Load Confluence config
-        config_path = Path(config)
-        if not config_path.exists():
-            click.echo(
-                f"Error: Confluence config file not found: {config_path}\n"
-                f"Create one from: conflu.json.example",
-                err=True
-            )
-            sys.exit(1)
-
-        with open(config_path) as f:
-            confluence_config = json.load(f).get('confluence', {})
-
-        # Create Confluence client
-        try:
-            confluence_client = create_confluence_client(confluence_config)
-            click.echo(f"✓ Connected to Confluence: {confluence_config['url']}")
-        except Exception as e:
-            click.echo(f"Error connecting to Confluence: {str(e)}", err=True)
-            sys.exit(1)
-
-        # Read report file
-        report_path = Path(report_file)
-        if report_path.suffix not in ['.html', '.htm']:
-            click.echo(
-                "Error: Report file must be HTML format.\n"
-                "Generate HTML report first: report-gen generate data.yaml -t feature_dev -o report.html",
-                err=True
-            )
-            sys.exit(1)
-
-        with open(report_path, 'r', encoding='utf-8') as f:
-            html_content = f.read()
+        from report_template.confluence_client import ConfluenceError, create_confluence_client
+    except ImportError as e:
+        raise click.ClickException(
+            "Requests library not available. Install with: pip install requests"
+        ) from e
+
+    # Load Confluence config
+    config_path = Path(config)
+    if not config_path.exists():
+        raise click.ClickException(
+            f"Confluence config file not found: {config_path}\n"
+            f"Create one from: conflu.json.example"
+        )
+
+    try:
+        confluence_config = _json.loads(config_path.read_bytes()).get('confluence', {})
+    except (OSError, ValueError, AttributeError) as e:
+        raise click.ClickException(
+            f"Invalid Confluence config file {config_path}: {str(e)}"
+        ) from e
+
+    # Create Confluence client
+    try:
+        confluence_client = create_confluence_client(confluence_config, gzip_requests=use_gzip)
+    except ValueError as e:  # missing or invalid config keys
+        raise click.ClickException(f"Could not connect to Confluence: {str(e)}") from e
+    click.echo(f"✓ Connected to Confluence: {confluence_config['url']}")
+
+    # Read report file
+    report_path = Path(report_file)
+    if report_path.suffix not in ['.html', '.htm']:
+        raise click.ClickException(
+            "Report file must be HTML format.\n"
+            "Generate HTML report first: report-gen generate data.yaml -t feature_dev -o report.html"
+        )
+
+    # Determine space key
+    space_key = space or confluence_config.get('space_key')
+    if not space_key:
+        raise click.ClickException(
+            "Space key not specified.\n"
+            "Either set it in conflu.json or use --space option."
+        )
+
+    try:
+        # Read the whole file in one call and decode once; the regex clean-up and
+        # the JSON request body both need text
+        html_content = report_path.read_bytes().decode('utf-8')
 
         # Prepare HTML for Confluence storage format
         click.echo("Preparing HTML for Confluence...")
@@ -714,41 +888,33 @@ def push_confluence(
         debug_numbered_file = report_path.with_suffix('.confluence-debug-numbered.txt')
 
         # Save clean HTML
-        with open(debug_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        debug_file.write_bytes(html_content.encode('utf-8'))
 
         # Save numbered version for easier debugging
         lines = html_content.split('\n')
-        with open(debug_numbered_file, 'w', encoding='utf-8') as f:
+        with open(debug_numbered_file, 'w', encoding='utf-8', buffering=_IO_BUF) as f:
             for i, line in enumerate(lines, 1):
                 f.write(f"{i:4d} | {line}\n")
+    except (OSError, UnicodeDecodeError) as e:
+        raise click.ClickException(str(e)) from e
+
+    if debug:
+        click.echo(f"\nDebug files created:")
+        click.echo(f"  - {debug_file} (clean HTML)")
+        click.echo(f"  - {debug_numbered_file} (with line numbers)")
+        click.echo(f"\nIf you get an error at [row,col], check line number in the numbered file")
 
-        if debug:
-            click.echo(f"\nDebug files created:")
-            click.echo(f"  - {debug_file} (clean HTML)")
-            click.echo(f"  - {debug_numbered_file} (with line numbers)")
-            click.echo(f"\nIf you get an error at [row,col], check line number in the numbered file")
-
-        # Determine space key
-        space_key = space or confluence_config.get('space_key')
-        if not space_key:
-            click.echo(
-                "Error: Space key not specified.\n"
-                "Either set it in conflu.json or use --space option.",
-                err=True
-            )
-            sys.exit(1)
-
-        # Determine page title
-        page_title = title or report_path.stem
-        click.echo(f"Page title: {page_title}")
-        click.echo(f"Space: {space_key}")
-
-        # Determine parent ID
-        page_parent_id = parent_id or confluence_config.get('parent_page_id')
-        if page_parent_id:
-            click.echo(f"Parent page ID: {page_parent_id}")
+    # Determine page title
+    page_title = title or report_path.stem
+    click.echo(f"Page title: {page_title}")
+    click.echo(f"Space: {space_key}")
 
+    # Determine parent ID
+    page_parent_id = parent_id or confluence_config.get('parent_page_id')
+    if page_parent_id:
+        click.echo(f"Parent page ID: {page_parent_id}")
+
+    try:
         # Push to Confluence
         click.echo("\nPushing to Confluence...")
         result = confluence_client.create_or_update_page(
@@ -757,21 +923,8 @@ def push_confluence(
             content=html_content,
             parent_id=page_parent_id
         )
-
-        page_url = confluence_client.get_page_url(result)
-        click.echo(f"\n✓ Successfully pushed to Confluence!")
-        click.echo(f"  Page URL: {page_url}")
-
-    except ImportError:
-        click.echo(
-            "Error: Requests library not available. "
-            "Install with: pip install requests",
-            err=True
-        )
-        sys.exit(1)
-    except Exception as e:
+    except ConfluenceError as e:
         error_msg = str(e)
-        click.echo(f"Error: {error_msg}", err=True)
 
         # Try to extract row/col from XHTML parsing error and show the problematic line
         import re as error_re
@@ -800,7 +953,7 @@ def push_confluence(
                         pointer = ' ' * (col - 1 - start) + '^'
                         click.echo(f"Context: {context}", err=True)
                         click.echo(f"         {pointer}", err=True)
-            except:
+            except IndexError:
                 pass
 
             click.echo(f"\n📝 Debug files created for inspection:", err=True)
@@ -809,7 +962,13 @@ def push_confluence(
         else:
             click.echo(f"\n📝 Debug file created: {debug_numbered_file}", err=True)
 
-        sys.exit(1)
+        raise click.ClickException(error_msg) from e
+    finally:
+        confluence_client.close()
+
+    page_url = confluence_client.get_page_url(result)
+    click.echo(f"\n✓ Successfully pushed to Confluence!")
+    click.echo(f"  Page URL: {page_url}")
 
 
 if __name__ == "__main__":
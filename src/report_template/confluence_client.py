@@ -2,32 +2,109 @@
 Confluence integration module for pushing reports to Confluence pages.
 """
 
-from typing import Any, Dict, Optional
+import gzip
+import time
+from typing import Any, Dict, List, Optional, Tuple
 import requests
 import re
 
+from report_template import _json
+
+# Maximum number of titles looked up in one CQL search request
+_TITLE_BATCH_SIZE = 50
+
+
+class ConfluenceError(Exception):
+    """Raised when a Confluence API request fails."""
+
+    def __init__(self, message: str, response: Optional[requests.Response] = None):
+        """
+        Initialize the error.
+
+        Args:
+            message: Error message
+            response: HTTP response of the failed request, if one was received
+        """
+        super().__init__(message)
+        self.response = response
+
+
+class ConfluenceConflictError(ConfluenceError):
+    """Raised when a page update is rejected because the page version is stale."""
+
 
 class ConfluenceClient:
     """Client for interacting with Confluence API using Personal Access Token (PAT)."""
 
-    def __init__(self, url: str, api_token: str):
+    def __init__(
+        self,
+        url: str,
+        api_token: str,
+        gzip_requests: bool = False,
+        page_cache_ttl: float = 60.0
+    ):
         """
         Initialize Confluence client with Personal Access Token.
 
         Args:
             url: Confluence server URL (e.g., 'https://confluence.example.com')
             api_token: Confluence Personal Access Token (PAT)
+            gzip_requests: Send page bodies gzip-compressed (Content-Encoding: gzip).
+                Only enable this if the server or proxy in front of it accepts
+                compressed request bodies.
+            page_cache_ttl: Seconds to remember the ID and version of pages looked up
+                or written by create_or_update_page(), so repeated pushes of the same
+                page skip the lookup request. 0 disables the cache.
 
         Note:
             This client uses Bearer token authentication with PAT.
             Basic authentication is not supported.
         """
         self.url = url.rstrip('/')
+        self._content_api_url = f"{self.url}/rest/api/content"
+        # Construct URL - may need adjustment based on your Confluence setup
+        self._view_page_url = f"{self.url}/pages/viewpage.action?pageId="
         self.headers = {
             "Authorization": f"Bearer {api_token}",
             "Accept": "application/json",
             "Content-Type": "application/json"
         }
+        self.gzip_requests = gzip_requests
+        self.page_cache_ttl = page_cache_ttl
+
+        # (space key, title) -> (time stored, page id/title/version)
+        self._page_cache: Dict[Tuple[str, str], Tuple[float, Dict[str, Any]]] = {}
+
+        # One session for all requests, so consecutive calls reuse the same
+        # keep-alive connection instead of doing a new TCP/TLS handshake each time
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and its connections."""
+        self._session.close()
+
+    def __enter__(self) -> "ConfluenceClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _page_body(self, page_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the request keyword arguments for sending page data as JSON.
+
+        The body is serialized up front (with orjson when installed) and sent as bytes;
+        the session already carries the application/json Content-Type.
+        """
+        body = _json.dumps(page_data)
+        if not self.gzip_requests:
+            return {"data": body}
+
+        return {"headers": {"Content-Encoding": "gzip"}, "data": gzip.compress(body)}
 
     @staticmethod
     def prepare_html_for_confluence(html_content: str) -> str:
@@ -98,9 +175,9 @@ class ConfluenceClient:
             Page data if found, None otherwise
 
         Raises:
-            Exception: If API error occurs
+            ConfluenceError: If API error occurs
         """
-        api_url = f"{self.url}/rest/api/content"
+        api_url = self._content_api_url
         params = {
             "spaceKey": space_key,
             "title": title,
@@ -108,7 +185,7 @@ class ConfluenceClient:
         }
 
         try:
-            response = requests.get(api_url, headers=self.headers, params=params, timeout=30)
+            response = self._session.get(api_url, params=params, timeout=30)
             response.raise_for_status()
             data = response.json()
 
@@ -117,7 +194,7 @@ class ConfluenceClient:
             return None
 
         except requests.exceptions.RequestException as e:
-            raise Exception(f"Failed to get page '{title}': {str(e)}") from e
+            raise ConfluenceError(f"Failed to get page '{title}': {str(e)}", e.response) from e
 
     def create_page(
         self,
@@ -139,9 +216,9 @@ class ConfluenceClient:
             Created page data
 
         Raises:
-            Exception: If page creation fails
+            ConfluenceError: If page creation fails
         """
-        api_url = f"{self.url}/rest/api/content"
+        api_url = self._content_api_url
 
         page_data = {
             "type": "page",
@@ -159,11 +236,10 @@ class ConfluenceClient:
             page_data["ancestors"] = [{"id": parent_id}]
 
         try:
-            response = requests.post(
+            response = self._session.post(
                 api_url,
-                headers=self.headers,
-                json=page_data,
-                timeout=30
+                timeout=30,
+                **self._page_body(page_data)
             )
             response.raise_for_status()
             return response.json()
@@ -178,24 +254,27 @@ class ConfluenceClient:
                 error_detail = e.response.text
 
             if e.response.status_code == 400:
-                raise Exception(
+                raise ConfluenceError(
                     f"Failed to create page '{title}': Invalid data.\n"
                     f"Space key: {space_key}\n"
                     f"Error details: {error_detail}\n"
-                    f"Tip: Check that the space key exists and your HTML content is valid."
+                    f"Tip: Check that the space key exists and your HTML content is valid.",
+                    e.response,
                 ) from e
             elif e.response.status_code == 403:
-                raise Exception(
+                raise ConfluenceError(
                     f"Access denied. Check your Confluence PAT has write permissions to space '{space_key}'.\n"
-                    f"Error details: {error_detail}"
+                    f"Error details: {error_detail}",
+                    e.response,
                 ) from e
             else:
-                raise Exception(
+                raise ConfluenceError(
                     f"Failed to create page '{title}': {str(e)}\n"
-                    f"Error details: {error_detail}"
+                    f"Error details: {error_detail}",
+                    e.response,
                 ) from e
         except requests.exceptions.RequestException as e:
-            raise Exception(f"Failed to connect to Confluence: {str(e)}") from e
+            raise ConfluenceError(f"Failed to connect to Confluence: {str(e)}") from e
 
     def update_page(
         self,
@@ -217,9 +296,10 @@ class ConfluenceClient:
             Updated page data
 
         Raises:
-            Exception: If page update fails
+            ConfluenceConflictError: If the page was updated by someone else
+            ConfluenceError: If page update fails
         """
-        api_url = f"{self.url}/rest/api/content/{page_id}"
+        api_url = f"{self._content_api_url}/{page_id}"
 
         page_data = {
             "version": {"number": version + 1},
@@ -234,25 +314,27 @@ class ConfluenceClient:
         }
 
         try:
-            response = requests.put(
+            response = self._session.put(
                 api_url,
-                headers=self.headers,
-                json=page_data,
-                timeout=30
+                timeout=30,
+                **self._page_body(page_data)
             )
             response.raise_for_status()
             return response.json()
 
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 409:
-                raise Exception(
+                raise ConfluenceConflictError(
                     f"Version conflict for page '{title}'. "
-                    "The page may have been updated by someone else. Try again."
+                    "The page may have been updated by someone else. Try again.",
+                    e.response,
                 ) from e
             else:
-                raise Exception(f"Failed to update page '{title}': {str(e)}") from e
+                raise ConfluenceError(
+                    f"Failed to update page '{title}': {str(e)}", e.response
+                ) from e
         except requests.exceptions.RequestException as e:
-            raise Exception(f"Failed to connect to Confluence: {str(e)}") from e
+            raise ConfluenceError(f"Failed to connect to Confluence: {str(e)}") from e
 
     def create_or_update_page(
         self,
@@ -274,21 +356,145 @@ class ConfluenceClient:
             Page data (created or updated)
 
         Raises:
-            Exception: If operation fails
+            ConfluenceError: If operation fails
         """
         # Check if page exists
-        existing_page = self.get_page_by_title(space_key, title)
+        existing_page = self._cached_page(space_key, title)
+        if existing_page is None:
+            existing_page = self.get_page_by_title(space_key, title)
+        return self._create_or_update(space_key, title, content, parent_id, existing_page)
+
+    def invalidate(self, space_key: str, title: str) -> None:
+        """
+        Forget the cached ID and version of a page.
+
+        Call this after the page was changed outside this client.
+
+        Args:
+            space_key: Confluence space key (e.g., 'PROJ')
+            title: Page title
+        """
+        self._page_cache.pop((space_key, title), None)
+
+    def _cached_page(self, space_key: str, title: str) -> Optional[Dict[str, Any]]:
+        """Get a page's cached ID and version if the entry hasn't expired."""
+        entry = self._page_cache.get((space_key, title))
+        if entry is None:
+            return None
+
+        stored_at, page = entry
+        if time.monotonic() - stored_at >= self.page_cache_ttl:
+            del self._page_cache[(space_key, title)]
+            return None
+        return page
+
+    def _cache_page(self, space_key: str, title: str, page: Dict[str, Any]) -> None:
+        """Remember the ID and version of a page that was just read or written."""
+        if self.page_cache_ttl <= 0 or "version" not in page:
+            return
+        self._page_cache[(space_key, title)] = (
+            time.monotonic(),
+            {"id": page["id"], "title": title, "version": {"number": page["version"]["number"]}},
+        )
+
+    def get_pages_by_titles(self, space_key: str, titles: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get several Confluence pages by title with CQL searches.
+
+        Titles are looked up in batches of up to 50 per request, instead of one
+        request per title.
 
+        Args:
+            space_key: Confluence space key (e.g., 'PROJ')
+            titles: Page titles
+
+        Returns:
+            Dictionary mapping title to page data (including version) for the
+            pages that exist
+
+        Raises:
+            ConfluenceError: If API error occurs
+        """
+        api_url = f"{self._content_api_url}/search"
+        pages: Dict[str, Dict[str, Any]] = {}
+
+        for start in range(0, len(titles), _TITLE_BATCH_SIZE):
+            batch = titles[start:start + _TITLE_BATCH_SIZE]
+            quoted = ", ".join(_cql_quote(title) for title in batch)
+            params = {
+                "cql": f"space = {_cql_quote(space_key)} and type = page and title in ({quoted})",
+                "expand": "version",
+                "limit": len(batch),
+            }
+
+            try:
+                response = self._session.get(api_url, params=params, timeout=30)
+                response.raise_for_status()
+            except requests.exceptions.RequestException as e:
+                raise ConfluenceError(
+                    f"Failed to search pages in space '{space_key}': {str(e)}", e.response
+                ) from e
+
+            for page in response.json().get("results", []):
+                pages[page["title"]] = page
+
+        return pages
+
+    def bulk_create_or_update(
+        self,
+        space_key: str,
+        pages: List[Tuple[str, str, Optional[str]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Create or update several pages, looking up the existing ones in bulk.
+
+        Args:
+            space_key: Confluence space key (e.g., 'PROJ')
+            pages: (title, content, parent_id) for each page; parent_id is used
+                only when creating
+
+        Returns:
+            Page data (created or updated) for each page, in the order given
+
+        Raises:
+            ConfluenceError: If any operation fails
+        """
+        existing_pages = self.get_pages_by_titles(space_key, [title for title, _, _ in pages])
+        return [
+            self._create_or_update(
+                space_key, title, content, parent_id, existing_pages.get(title)
+            )
+            for title, content, parent_id in pages
+        ]
+
+    def _create_or_update(
+        self,
+        space_key: str,
+        title: str,
+        content: str,
+        parent_id: Optional[str],
+        existing_page: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Update existing_page if given, otherwise create a new page."""
         if existing_page:
             # Update existing page
             page_id = existing_page["id"]
             version = existing_page["version"]["number"]
             print(f"Updating existing page '{title}' (ID: {page_id}, Version: {version})")
-            return self.update_page(page_id, title, content, version)
+            try:
+                result = self.update_page(page_id, title, content, version)
+            except ConfluenceError:
+                # The cached version may be stale; look the page up again next time
+                self.invalidate(space_key, title)
+                raise
         else:
             # Create new page
             print(f"Creating new page '{title}' in space '{space_key}'")
-            return self.create_page(space_key, title, content, parent_id)
+            result = self.create_page(space_key, title, content, parent_id)
+
+        # The response carries the new version number for the next update
+        self._cache_page(space_key, title, result)
+        return result
 
     def get_page_url(self, page_data: Dict[str, Any]) -> str:
         """
@@ -300,18 +506,23 @@ class ConfluenceClient:
         Returns:
             Full URL to the page
         """
-        page_id = page_data.get("id")
-        # Construct URL - may need adjustment based on your Confluence setup
-        return f"{self.url}/pages/viewpage.action?pageId={page_id}"
+        return f"{self._view_page_url}{page_data.get('id')}"
+
+
+def _cql_quote(value: str) -> str:
+    """Quote a string literal for use in a CQL query."""
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
 
 
-def create_confluence_client(config: Dict[str, str]) -> ConfluenceClient:
+def create_confluence_client(config: Dict[str, str], gzip_requests: bool = False) -> ConfluenceClient:
     """
     Create Confluence client from configuration dictionary.
 
     Args:
         config: Dictionary with 'url' and 'api_token' keys
                 'api_token' should be a Personal Access Token (PAT)
+        gzip_requests: Send page bodies gzip-compressed
 
     Returns:
         ConfluenceClient instance
@@ -327,5 +538,6 @@ def create_confluence_client(config: Dict[str, str]) -> ConfluenceClient:
 
     return ConfluenceClient(
         url=config['url'],
-        api_token=config['api_token']
+        api_token=config['api_token'],
+        gzip_requests=gzip_requests
     )
@@ -0,0 +1,44 @@
+"""
+Enumerations shared by the report models, generator and CLI.
+
+Kept free of third-party imports so the CLI can build its options without
+loading Pydantic or Jinja2.
+"""
+
+from enum import Enum
+
+
+class ReportType(str, Enum):
+    """Supported report types."""
+
+    FEATURE_DEV = "feature_dev"
+    PROGRAM_MGMT = "program_mgmt"
+    ENGINEERING_INIT = "engineering_init"
+
+
+class OutputFormat(str, Enum):
+    """Supported output formats."""
+
+    MARKDOWN = "markdown"
+    HTML = "html"
+    PDF = "pdf"
+    DOCX = "docx"
+
+
+class Status(str, Enum):
+    """Project/task status options."""
+
+    NOT_STARTED = "Not Started"
+    IN_PROGRESS = "In Progress"
+    COMPLETED = "Completed"
+    BLOCKED = "Blocked"
+    ON_HOLD = "On Hold"
+
+
+class Priority(str, Enum):
+    """Priority levels."""
+
+    LOW = "Low"
+    MEDIUM = "Medium"
+    HIGH = "High"
+    CRITICAL = "Critical"
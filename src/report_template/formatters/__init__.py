@@ -6,5 +6,12 @@ from report_template.formatters.html import render_html
 from report_template.formatters.markdown import render_markdown
 from report_template.formatters.pdf import html_to_pdf
 from report_template.formatters.docx import create_docx_report
+from report_template.formatters.batch import create_reports_batch
 
-__all__ = ["render_markdown", "render_html", "html_to_pdf", "create_docx_report"]
+__all__ = [
+    "render_markdown",
+    "render_html",
+    "html_to_pdf",
+    "create_docx_report",
+    "create_reports_batch",
+]
@@ -0,0 +1,55 @@
+"""
+Batch conversion of many reports in parallel worker processes.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple, cast
+
+from report_template.formatters.docx import create_docx_report
+from report_template.formatters.pdf import markdown_to_pdf
+
+
+def _docx_worker(item: Tuple[Dict[str, Any], str]) -> bytes:
+    """Build one DOCX report from a (data, report_type) pair."""
+    data, report_type = item
+    # Without an output path the document is returned as bytes, never None
+    return cast(bytes, create_docx_report(data, report_type))
+
+
+def _pdf_worker(markdown_text: str) -> bytes:
+    """Convert one Markdown report to PDF."""
+    # Without an output path the PDF is returned as bytes, never None
+    return cast(bytes, markdown_to_pdf(markdown_text))
+
+
+_WORKERS = {"docx": _docx_worker, "pdf": _pdf_worker}
+
+
+def create_reports_batch(
+    items: Iterable[Any], fmt: str = "docx", workers: Optional[int] = None
+) -> List[bytes]:
+    """
+    Create many reports in parallel, one worker process per CPU by default.
+
+    Building DOCX documents and rendering PDFs is CPU-bound pure Python work, so
+    spreading independent reports across processes scales with the number of cores.
+
+    Args:
+        items: For "docx", (data, report_type) pairs as accepted by create_docx_report();
+            for "pdf", Markdown strings as accepted by markdown_to_pdf().
+        fmt: Output format, "docx" or "pdf".
+        workers: Maximum number of worker processes. Defaults to the number of CPUs.
+
+    Returns:
+        Report contents as bytes, in the same order as items.
+
+    Raises:
+        ValueError: If fmt is not supported.
+    """
+    try:
+        worker = _WORKERS[fmt]
+    except KeyError:
+        raise ValueError(f"Unsupported batch format: {fmt}. Use 'docx' or 'pdf'") from None
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(worker, items, chunksize=4))
@@ -2,29 +2,59 @@
 DOCX formatter utilities using python-docx.
 """
 
+import importlib.util
+import re
 from datetime import date
-from typing import Any, Dict, List, Union
+from enum import Enum
+from functools import lru_cache
+from io import BytesIO
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, List, Optional, Tuple
+from xml.sax.saxutils import escape
 
-try:
-    from docx import Document
-    from docx.shared import Inches, Pt, RGBColor
-    from docx.enum.text import WD_ALIGN_PARAGRAPH
-    from docx.enum.style import WD_STYLE_TYPE
-    PYTHON_DOCX_AVAILABLE = True
-except ImportError:
-    PYTHON_DOCX_AVAILABLE = False
+if TYPE_CHECKING:
+    from docx.document import Document
+
+# python-docx pulls in lxml, so only check that it is installed here and import
+# it on first use through _docx(). Markdown/HTML-only code paths never load it.
+PYTHON_DOCX_AVAILABLE = importlib.util.find_spec("docx") is not None
 
+# Tabs and line breaks become <w:tab/> and <w:br/> elements, as with run.text
+_RUN_SPECIAL_CHARS = re.compile(r"(\t|\r\n|\r|\n)")
 
-def create_docx_report(data: Dict[str, Any], report_type: str) -> bytes:
+
+@lru_cache(maxsize=None)
+def _docx() -> SimpleNamespace:
+    """Import the python-docx names used by this module."""
+    from docx import Document
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+    from docx.oxml import parse_xml
+    from docx.oxml.ns import nsdecls
+    from docx.shared import RGBColor
+
+    return SimpleNamespace(
+        Document=Document,
+        WD_ALIGN_PARAGRAPH=WD_ALIGN_PARAGRAPH,
+        parse_xml=parse_xml,
+        nsdecls=nsdecls,
+        RGBColor=RGBColor,
+    )
+
+
+def create_docx_report(
+    data: Dict[str, Any], report_type: str, out: Optional[BinaryIO] = None
+) -> Optional[bytes]:
     """
     Create a DOCX report from data.
 
     Args:
         data: Report data dictionary.
         report_type: Type of report (feature_dev, program_mgmt, engineering_init).
+        out: Optional seekable binary stream to save the document to. Saving straight
+            to a file avoids holding a second in-memory copy of the document.
 
     Returns:
-        DOCX file content as bytes.
+        DOCX file content as bytes, or None if the document was saved to out.
 
     Raises:
         ImportError: If python-docx is not installed.
@@ -35,7 +65,7 @@ def create_docx_report(data: Dict[str, Any], report_type: str) -> bytes:
             "Install it with: pip install python-docx"
         )
 
-    doc = Document()
+    doc = _docx().Document()
 
     # Set up styles
     _setup_styles(doc)
@@ -50,11 +80,13 @@ def create_docx_report(data: Dict[str, Any], report_type: str) -> bytes:
     else:
         raise ValueError(f"Unknown report type: {report_type}")
 
+    if out is not None:
+        doc.save(out)
+        return None
+
     # Save to bytes
-    from io import BytesIO
     docx_bytes = BytesIO()
     doc.save(docx_bytes)
-    docx_bytes.seek(0)
     return docx_bytes.getvalue()
 
 
@@ -67,15 +99,11 @@ def _setup_styles(doc: "Document") -> None:
     if 'Title' in styles:
         title_style = styles['Title']
         title_font = title_style.font
-        title_font.color.rgb = RGBColor(44, 62, 80)  # Dark blue-gray
+        title_font.color.rgb = _docx().RGBColor(44, 62, 80)  # Dark blue-gray
 
 
 def _add_metadata_section(doc: "Document", data: Dict[str, Any]) -> None:
     """Add metadata section to document."""
-    # Add a light gray background table for metadata
-    table = doc.add_table(rows=0, cols=2)
-    table.style = 'Light Shading Accent 1'
-
     metadata_fields = [
         ("Project", data.get("project_name", "N/A")),
         ("Author", data.get("author", "N/A")),
@@ -98,14 +126,15 @@ def _add_metadata_section(doc: "Document", data: Dict[str, Any]) -> None:
     if "sprint" in data and data["sprint"]:
         metadata_fields.append(("Sprint", data["sprint"]))
     if "status" in data and data["status"]:
-        status_value = data["status"]["value"] if isinstance(data["status"], dict) else str(data["status"])
-        metadata_fields.append(("Status", status_value))
+        metadata_fields.append(("Status", _enum_value(data, "status")))
 
-    for label, value in metadata_fields:
-        row = table.add_row()
-        row.cells[0].text = label
-        row.cells[0].paragraphs[0].runs[0].bold = True
-        row.cells[1].text = str(value)
+    # Add a light gray background table for metadata, labels in bold
+    _append_table(
+        doc,
+        'Light Shading Accent 1',
+        [[label, str(value)] for label, value in metadata_fields],
+        bold_first_column=True,
+    )
 
     doc.add_paragraph()  # Add spacing
 
@@ -116,24 +145,104 @@ def _add_table(doc: "Document", headers: List[str], rows: List[List[str]]) -> No
         doc.add_paragraph("No data available.", style='Normal')
         return
 
-    table = doc.add_table(rows=1, cols=len(headers))
-    table.style = 'Light Grid Accent 1'
+    _append_table(
+        doc,
+        'Light Grid Accent 1',
+        [headers] + [[str(cell_data) for cell_data in row_data] for row_data in rows],
+        bold_first_row=True,
+    )
 
-    # Header row
-    header_cells = table.rows[0].cells
-    for i, header in enumerate(headers):
-        header_cells[i].text = header
-        for paragraph in header_cells[i].paragraphs:
-            for run in paragraph.runs:
-                run.bold = True
+    doc.add_paragraph()  # Add spacing
 
-    # Data rows
-    for row_data in rows:
-        row = table.add_row()
-        for i, cell_data in enumerate(row_data):
-            row.cells[i].text = str(cell_data)
 
-    doc.add_paragraph()  # Add spacing
+def _append_table(
+    doc: "Document",
+    style_name: str,
+    rows: List[List[str]],
+    bold_first_row: bool = False,
+    bold_first_column: bool = False,
+) -> None:
+    """
+    Append a table to the document body, built as one XML fragment.
+
+    Produces the same markup as doc.add_table() followed by setting each cell's
+    text, without creating python-docx objects for every row, cell and run.
+
+    Args:
+        doc: Document to append to.
+        style_name: Name of a table style defined in the document.
+        rows: Cell text for each row; all rows have the same number of cells.
+        bold_first_row: Whether the first row is bold (a header row).
+        bold_first_column: Whether the first cell of each row is bold.
+    """
+    ncols = len(rows[0])
+    section = doc.sections[-1]
+    block_width = section.page_width - section.left_margin - section.right_margin
+    col_width = block_width // ncols // 635  # EMU to twips
+    tc_pr = f'<w:tcPr><w:tcW w:type="dxa" w:w="{col_width}"/></w:tcPr>'
+    grid_col = f'<w:gridCol w:w="{col_width}"/>'
+
+    parts = [
+        f'<w:tbl {_docx().nsdecls("w")}><w:tblPr>'
+        f'<w:tblStyle w:val="{doc.styles[style_name].style_id}"/>'
+        '<w:tblW w:type="auto" w:w="0"/>'
+        '<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" w:lastRow="0" '
+        'w:noHBand="0" w:noVBand="1" w:val="04A0"/>'
+        f'</w:tblPr><w:tblGrid>{grid_col * ncols}</w:tblGrid>'
+    ]
+    for r, row in enumerate(rows):
+        parts.append("<w:tr>")
+        for c, text in enumerate(row):
+            bold = (bold_first_row and r == 0) or (bold_first_column and c == 0)
+            parts.append(f"<w:tc>{tc_pr}<w:p>{_run_xml(text, bold)}</w:p></w:tc>")
+        parts.append("</w:tr>")
+    parts.append("</w:tbl>")
+
+    _append_block(doc, _docx().parse_xml("".join(parts)))
+
+
+def _add_runs_paragraph(doc: "Document", runs: List[Tuple[str, bool]]) -> None:
+    """
+    Append a paragraph made of (text, bold) runs, built as one XML fragment.
+
+    Equivalent to doc.add_paragraph() followed by add_run() per run, without
+    creating a Run object and element for each call.
+    """
+    run_xml = "".join(_run_xml(text, bold) for text, bold in runs)
+    paragraph = _docx().parse_xml(f'<w:p {_docx().nsdecls("w")}>{run_xml}</w:p>')
+    _append_block(doc, paragraph)
+
+
+def _append_block(doc: "Document", element: Any) -> None:
+    """Append a paragraph or table element to the body, before the final section properties."""
+    body = doc.element.body
+    if body.sectPr is not None:
+        body.sectPr.addprevious(element)
+    else:
+        body.append(element)
+
+
+def _run_xml(text: str, bold: bool = False) -> str:
+    """Build the XML for a run holding text, optionally bold."""
+    parts = ["<w:r>"]
+    if bold:
+        parts.append("<w:rPr><w:b/></w:rPr>")
+    for piece in _RUN_SPECIAL_CHARS.split(text):
+        if piece == "\t":
+            parts.append("<w:tab/>")
+        elif piece in ("\n", "\r", "\r\n"):
+            parts.append("<w:br/>")
+        elif piece:
+            parts.append(f'<w:t xml:space="preserve">{escape(piece)}</w:t>')
+    parts.append("</w:r>")
+    return "".join(parts)
+
+
+def _set_footer(doc: "Document", text: str) -> None:
+    """Set the centered footer text of the document."""
+    footer_para = doc.sections[0].footer.paragraphs[0]
+    footer_para.text = text
+    footer_para.alignment = _docx().WD_ALIGN_PARAGRAPH.CENTER
 
 
 def _add_list(doc: "Document", items: List[str], style: str = 'List Bullet') -> None:
@@ -142,50 +251,110 @@ def _add_list(doc: "Document", items: List[str], style: str = 'List Bullet') ->
         doc.add_paragraph("None specified.", style='Normal')
         return
 
+    # Look the style up by name once; passing the style object to add_paragraph
+    # skips the per-paragraph search of the styles part
+    list_style = doc.styles[style]
     for item in items:
-        doc.add_paragraph(str(item), style=style)
+        doc.add_paragraph(str(item), style=list_style)
 
     doc.add_paragraph()  # Add spacing
 
 
+def _enum_value(item: Dict[str, Any], key: str, default: str = "N/A") -> str:
+    """
+    Get the display value of an enum field such as a status or priority.
+
+    The field may hold an Enum member (from a model), a plain string (from a data
+    file) or a {"value": ...} dict.
+    """
+    value = item.get(key)
+    if value is None:
+        return default
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, dict):
+        return value.get("value", default)
+    return str(value)
+
+
+@lru_cache(maxsize=256)
+def _iso_date(date_value: date) -> str:
+    """Format a date as YYYY-MM-DD; cached because rows often share dates."""
+    return f"{date_value.year:04d}-{date_value.month:02d}-{date_value.day:02d}"
+
+
 def _format_date(date_value: Any) -> str:
     """Format a date value to string."""
     if isinstance(date_value, date):
-        return date_value.strftime("%Y-%m-%d")
+        return _iso_date(date_value)
     elif isinstance(date_value, str):
         return date_value
     return "N/A"
 
 
+def _add_text_section(doc: "Document", heading: str, text: str) -> None:
+    """Add a level 1 heading followed by a paragraph of text and a spacer."""
+    doc.add_heading(heading, level=1)
+    doc.add_paragraph(text)
+    doc.add_paragraph()
+
+
+def _add_text_sections(
+    doc: "Document", data: Dict[str, Any], sections: List[Tuple[str, str, str]]
+) -> None:
+    """Add free-text sections given as (heading, data key, default text) tuples."""
+    for heading, key, default in sections:
+        _add_text_section(doc, heading, data.get(key, default))
+
+
+def _render_team(doc: "Document", team_members: List[Dict[str, Any]]) -> None:
+    """Add the team members table, or a note if there are none."""
+    if not team_members:
+        doc.add_paragraph("No team members specified.")
+        doc.add_paragraph()
+        return
+
+    team_rows = [
+        [member.get("name", "N/A"), member.get("role", "N/A"), member.get("email", "N/A")]
+        for member in team_members
+    ]
+    _add_table(doc, ["Name", "Role", "Email"], team_rows)
+
+
+def _render_milestones(doc: "Document", milestones: List[Dict[str, Any]]) -> None:
+    """Add the milestones table, or a note if there are none."""
+    if not milestones:
+        doc.add_paragraph("No milestones defined.")
+        doc.add_paragraph()
+        return
+
+    milestone_rows = [
+        [
+            milestone.get("name", "N/A"),
+            _format_date(milestone.get("target_date")),
+            _enum_value(milestone, "status"),
+            f"{milestone.get('completion_percentage', 0)}%"
+        ]
+        for milestone in milestones
+    ]
+    _add_table(doc, ["Milestone", "Target Date", "Status", "Completion"], milestone_rows)
+
+
 def _create_feature_dev_report(doc: "Document", data: Dict[str, Any]) -> None:
     """Create a feature development report."""
     # Title
     title = doc.add_heading(data.get("title", "Feature Development Report"), level=0)
-    title.alignment = WD_ALIGN_PARAGRAPH.LEFT
+    title.alignment = _docx().WD_ALIGN_PARAGRAPH.LEFT
 
     # Metadata
     _add_metadata_section(doc, data)
 
     # Executive Summary
-    doc.add_heading("Executive Summary", level=1)
-    doc.add_paragraph(data.get("summary", "No summary provided."))
-    doc.add_paragraph()
+    _add_text_section(doc, "Executive Summary", data.get("summary", "No summary provided."))
 
     # Team
     doc.add_heading("Team", level=1)
-    team_members = data.get("team_members", [])
-    if team_members:
-        team_rows = []
-        for member in team_members:
-            team_rows.append([
-                member.get("name", "N/A"),
-                member.get("role", "N/A"),
-                member.get("email", "N/A")
-            ])
-        _add_table(doc, ["Name", "Role", "Email"], team_rows)
-    else:
-        doc.add_paragraph("No team members specified.")
-        doc.add_paragraph()
+    _render_team(doc, data.get("team_members", []))
 
     # Objectives
     doc.add_heading("Objectives", level=1)
@@ -196,9 +365,9 @@ def _create_feature_dev_report(doc: "Document", data: Dict[str, Any]) -> None:
     _add_list(doc, data.get("requirements", []))
 
     # Technical Approach
-    doc.add_heading("Technical Approach", level=1)
-    doc.add_paragraph(data.get("technical_approach", "To be determined."))
-    doc.add_paragraph()
+    _add_text_section(
+        doc, "Technical Approach", data.get("technical_approach", "To be determined.")
+    )
 
     if data.get("architecture_notes"):
         doc.add_heading("Architecture Notes", level=2)
@@ -209,23 +378,19 @@ def _create_feature_dev_report(doc: "Document", data: Dict[str, Any]) -> None:
     doc.add_heading("Tasks & Progress", level=1)
     tasks = data.get("tasks", [])
     if tasks:
-        task_rows = []
-        for task in tasks:
-            status = task.get("status", {})
-            priority = task.get("priority", {})
-            status_value = status.get("value", "N/A") if isinstance(status, dict) else str(status)
-            priority_value = priority.get("value", "N/A") if isinstance(priority, dict) else str(priority)
-
-            task_rows.append([
+        task_rows = [
+            [
                 task.get("title", "N/A"),
                 task.get("assignee", "Unassigned"),
-                status_value,
-                priority_value,
+                _enum_value(task, "status"),
+                _enum_value(task, "priority"),
                 task.get("jira_id", "N/A"),
                 _format_date(task.get("target_start_date")),
                 _format_date(task.get("target_end_date")),
                 _format_date(task.get("due_date"))
-            ])
+            ]
+            for task in tasks
+        ]
         _add_table(doc, ["Task", "Assignee", "Status", "Priority", "JIRA", "Start Date", "End Date", "Due Date"], task_rows)
     else:
         doc.add_paragraph("No tasks defined.")
@@ -238,33 +403,13 @@ def _create_feature_dev_report(doc: "Document", data: Dict[str, Any]) -> None:
 
     # Milestones
     doc.add_heading("Milestones", level=1)
-    milestones = data.get("milestones", [])
-    if milestones:
-        milestone_rows = []
-        for milestone in milestones:
-            status = milestone.get("status", {})
-            status_value = status.get("value", "N/A") if isinstance(status, dict) else str(status)
-
-            milestone_rows.append([
-                milestone.get("name", "N/A"),
-                _format_date(milestone.get("target_date")),
-                status_value,
-                f"{milestone.get('completion_percentage', 0)}%"
-            ])
-        _add_table(doc, ["Milestone", "Target Date", "Status", "Completion"], milestone_rows)
-    else:
-        doc.add_paragraph("No milestones defined.")
-        doc.add_paragraph()
+    _render_milestones(doc, data.get("milestones", []))
 
-    # Testing Strategy
-    doc.add_heading("Testing Strategy", level=1)
-    doc.add_paragraph(data.get("testing_strategy", "To be defined."))
-    doc.add_paragraph()
-
-    # Deployment Plan
-    doc.add_heading("Deployment Plan", level=1)
-    doc.add_paragraph(data.get("deployment_plan", "To be defined."))
-    doc.add_paragraph()
+    # Testing Strategy and Deployment Plan
+    _add_text_sections(doc, data, [
+        ("Testing Strategy", "testing_strategy", "To be defined."),
+        ("Deployment Plan", "deployment_plan", "To be defined."),
+    ])
 
     # Action Points
     doc.add_heading("Action Points", level=1)
@@ -272,20 +417,16 @@ def _create_feature_dev_report(doc: "Document", data: Dict[str, Any]) -> None:
     if ap:
         for i, action in enumerate(ap, 1):
             doc.add_heading(f"{i}. {action.get('description', 'action_point')}", level=2)
-            impact = action.get("impact", {})
-            ap_priority = action.get("ap_priority", {})
-            impact_value = impact.get("value", "N/A") if isinstance(impact, dict) else str(impact)
-            likelihood_value = ap_priority.get("value", "N/A") if isinstance(ap_priority, dict) else str(ap_priority)
-
-            p = doc.add_paragraph()
-            p.add_run("Impact: ").bold = True
-            p.add_run(impact_value + "\n")
-            p.add_run("Likelihood: ").bold = True
-            p.add_run(likelihood_value + "\n")
-            p.add_run("Mitigation: ").bold = True
+            runs = [
+                ("Impact: ", True),
+                (_enum_value(action, "impact") + "\n", False),
+                ("Likelihood: ", True),
+                (_enum_value(action, "ap_priority") + "\n", False),
+                ("Mitigation: ", True),
+            ]
             if action.get("owner"):
-                p.add_run("\nOwner: ").bold = True
-                p.add_run(ap["owner"])
+                runs += [("\nOwner: ", True), (action["owner"], False)]
+            _add_runs_paragraph(doc, runs)
             doc.add_paragraph()
     else:
         doc.add_paragraph("No Action Points identified.")
@@ -296,26 +437,24 @@ def _create_feature_dev_report(doc: "Document", data: Dict[str, Any]) -> None:
     _add_list(doc, data.get("dependencies", []))
 
     # Footer
-    footer_section = doc.sections[0]
-    footer = footer_section.footer
-    footer_para = footer.paragraphs[0]
-    footer_para.text = f"Generated on {_format_date(data.get('date', date.today()))}"
-    footer_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    _set_footer(doc, f"Generated on {_format_date(data.get('date', date.today()))}")
 
 
 def _create_program_mgmt_report(doc: "Document", data: Dict[str, Any]) -> None:
     """Create a program management report."""
     # Title
     title = doc.add_heading(data.get("title", "Program Management Report"), level=0)
-    title.alignment = WD_ALIGN_PARAGRAPH.LEFT
+    title.alignment = _docx().WD_ALIGN_PARAGRAPH.LEFT
 
     # Metadata
     _add_metadata_section(doc, data)
 
     # Executive Summary
-    doc.add_heading("Executive Summary", level=1)
-    doc.add_paragraph(data.get("executive_summary", data.get("summary", "No summary provided.")))
-    doc.add_paragraph()
+    _add_text_section(
+        doc,
+        "Executive Summary",
+        data.get("executive_summary", data.get("summary", "No summary provided.")),
+    )
 
     # Stakeholders
     doc.add_heading("Stakeholders", level=1)
@@ -323,19 +462,7 @@ def _create_program_mgmt_report(doc: "Document", data: Dict[str, Any]) -> None:
 
     # Team
     doc.add_heading("Team Composition", level=1)
-    team_members = data.get("team_members", [])
-    if team_members:
-        team_rows = []
-        for member in team_members:
-            team_rows.append([
-                member.get("name", "N/A"),
-                member.get("role", "N/A"),
-                member.get("email", "N/A")
-            ])
-        _add_table(doc, ["Name", "Role", "Email"], team_rows)
-    else:
-        doc.add_paragraph("No team members specified.")
-        doc.add_paragraph()
+    _render_team(doc, data.get("team_members", []))
 
     # KPIs
     doc.add_heading("Key Performance Indicators (KPIs)", level=1)
@@ -349,23 +476,7 @@ def _create_program_mgmt_report(doc: "Document", data: Dict[str, Any]) -> None:
 
     # Milestones
     doc.add_heading("Milestones & Progress", level=1)
-    milestones = data.get("milestones", [])
-    if milestones:
-        milestone_rows = []
-        for milestone in milestones:
-            status = milestone.get("status", {})
-            status_value = status.get("value", "N/A") if isinstance(status, dict) else str(status)
-
-            milestone_rows.append([
-                milestone.get("name", "N/A"),
-                _format_date(milestone.get("target_date")),
-                status_value,
-                f"{milestone.get('completion_percentage', 0)}%"
-            ])
-        _add_table(doc, ["Milestone", "Target Date", "Status", "Completion"], milestone_rows)
-    else:
-        doc.add_paragraph("No milestones defined.")
-        doc.add_paragraph()
+    _render_milestones(doc, data.get("milestones", []))
 
     # Key Achievements
     doc.add_heading("Key Achievements", level=1)
@@ -379,29 +490,25 @@ def _create_program_mgmt_report(doc: "Document", data: Dict[str, Any]) -> None:
     doc.add_heading("Action Points", level=1)
     action_points = data.get("action_points", [])
     if action_points:
-        action_point_rows = []
-        for action_point in action_points:
-            priority = action_point.get("priority", {})
-            status = action_point.get("status", {})
-            priority_value = priority.get("value", "N/A") if isinstance(priority, dict) else str(priority)
-            status_value = status.get("value", "N/A") if isinstance(status, dict) else str(status)
-
-            action_point_rows.append([
+        action_point_rows = [
+            [
                 action_point.get("description", "N/A"),
-                priority_value,
-                status_value,
+                _enum_value(action_point, "priority"),
+                _enum_value(action_point, "status"),
                 action_point.get("owner", "N/A"),
                 str(action_point.get("due_date", "N/A"))
-            ])
+            ]
+            for action_point in action_points
+        ]
         _add_table(doc, ["Action Point", "Priority", "Status", "Owner", "Due Date"], action_point_rows)
     else:
         doc.add_paragraph("No action points.")
         doc.add_paragraph()
 
     # Budget Summary
-    doc.add_heading("Budget Summary", level=1)
-    doc.add_paragraph(data.get("budget_summary", "No budget information provided."))
-    doc.add_paragraph()
+    _add_text_section(
+        doc, "Budget Summary", data.get("budget_summary", "No budget information provided.")
+    )
 
     # Upcoming Activities
     doc.add_heading("Upcoming Activities", level=1)
@@ -412,26 +519,20 @@ def _create_program_mgmt_report(doc: "Document", data: Dict[str, Any]) -> None:
     _add_list(doc, data.get("decisions_needed", []))
 
     # Footer
-    footer_section = doc.sections[0]
-    footer = footer_section.footer
-    footer_para = footer.paragraphs[0]
-    footer_para.text = f"Report generated on {_format_date(data.get('date', date.today()))}"
-    footer_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    _set_footer(doc, f"Report generated on {_format_date(data.get('date', date.today()))}")
 
 
 def _create_engineering_init_report(doc: "Document", data: Dict[str, Any]) -> None:
     """Create an engineering initiative report."""
     # Title
     title = doc.add_heading(data.get("title", "Engineering Initiative Report"), level=0)
-    title.alignment = WD_ALIGN_PARAGRAPH.LEFT
+    title.alignment = _docx().WD_ALIGN_PARAGRAPH.LEFT
 
     # Metadata
     _add_metadata_section(doc, data)
 
     # Executive Summary
-    doc.add_heading("Executive Summary", level=1)
-    doc.add_paragraph(data.get("summary", "No summary provided."))
-    doc.add_paragraph()
+    _add_text_section(doc, "Executive Summary", data.get("summary", "No summary provided."))
 
     # Sponsors
     doc.add_heading("Sponsors", level=1)
@@ -439,33 +540,17 @@ def _create_engineering_init_report(doc: "Document", data: Dict[str, Any]) -> No
 
     # Team
     doc.add_heading("Team", level=1)
-    team_members = data.get("team_members", [])
-    if team_members:
-        team_rows = []
-        for member in team_members:
-            team_rows.append([
-                member.get("name", "N/A"),
-                member.get("role", "N/A"),
-                member.get("email", "N/A")
-            ])
-        _add_table(doc, ["Name", "Role", "Email"], team_rows)
-    else:
-        doc.add_paragraph("No team members specified.")
-        doc.add_paragraph()
+    _render_team(doc, data.get("team_members", []))
 
     # Objectives
     doc.add_heading("Objectives", level=1)
     _add_list(doc, data.get("objectives", []))
 
-    # Scope
-    doc.add_heading("Scope", level=1)
-    doc.add_paragraph(data.get("scope", "To be defined."))
-    doc.add_paragraph()
-
-    # Technical Details
-    doc.add_heading("Technical Details", level=1)
-    doc.add_paragraph(data.get("technical_details", "To be defined."))
-    doc.add_paragraph()
+    # Scope and Technical Details
+    _add_text_sections(doc, data, [
+        ("Scope", "scope", "To be defined."),
+        ("Technical Details", "technical_details", "To be defined."),
+    ])
 
     # Implementation Phases
     doc.add_heading("Implementation Phases", level=1)
@@ -477,12 +562,9 @@ def _create_engineering_init_report(doc: "Document", data: Dict[str, Any]) -> No
             if phase.get("description"):
                 doc.add_paragraph(phase["description"])
             if phase.get("duration"):
-                p = doc.add_paragraph()
-                p.add_run("Duration: ").bold = True
-                p.add_run(str(phase["duration"]))
+                _add_runs_paragraph(doc, [("Duration: ", True), (str(phase["duration"]), False)])
             if phase.get("deliverables"):
-                p = doc.add_paragraph()
-                p.add_run("Deliverables:").bold = True
+                _add_runs_paragraph(doc, [("Deliverables:", True)])
                 _add_list(doc, phase["deliverables"])
     else:
         doc.add_paragraph("No implementation phases defined.")
@@ -494,33 +576,13 @@ def _create_engineering_init_report(doc: "Document", data: Dict[str, Any]) -> No
 
     # Milestones
     doc.add_heading("Milestones", level=1)
-    milestones = data.get("milestones", [])
-    if milestones:
-        milestone_rows = []
-        for milestone in milestones:
-            status = milestone.get("status", {})
-            status_value = status.get("value", "N/A") if isinstance(status, dict) else str(status)
-
-            milestone_rows.append([
-                milestone.get("name", "N/A"),
-                _format_date(milestone.get("target_date")),
-                status_value,
-                f"{milestone.get('completion_percentage', 0)}%"
-            ])
-        _add_table(doc, ["Milestone", "Target Date", "Status", "Completion"], milestone_rows)
-    else:
-        doc.add_paragraph("No milestones defined.")
-        doc.add_paragraph()
+    _render_milestones(doc, data.get("milestones", []))
 
-    # Impact Analysis
-    doc.add_heading("Impact Analysis", level=1)
-    doc.add_paragraph(data.get("impact_analysis", "To be defined."))
-    doc.add_paragraph()
-
-    # Resources Required
-    doc.add_heading("Resources Required", level=1)
-    doc.add_paragraph(data.get("resources_required", "To be defined."))
-    doc.add_paragraph()
+    # Impact Analysis and Resources Required
+    _add_text_sections(doc, data, [
+        ("Impact Analysis", "impact_analysis", "To be defined."),
+        ("Resources Required", "resources_required", "To be defined."),
+    ])
 
     # Action Points
     doc.add_heading("Action Points", level=1)
@@ -528,35 +590,24 @@ def _create_engineering_init_report(doc: "Document", data: Dict[str, Any]) -> No
     if action_points:
         for i, action_point in enumerate(action_points, 1):
             doc.add_heading(f"{i}. {action_point.get('description', 'Action Point')}", level=2)
-            priority = action_point.get("priority", {})
-            status = action_point.get("status", {})
-            priority_value = priority.get("value", "N/A") if isinstance(priority, dict) else str(priority)
-            status_value = status.get("value", "N/A") if isinstance(status, dict) else str(status)
-
-            p = doc.add_paragraph()
-            p.add_run("Priority: ").bold = True
-            p.add_run(priority_value + "\n")
-            p.add_run("Status: ").bold = True
-            p.add_run(status_value)
+            runs = [
+                ("Priority: ", True),
+                (_enum_value(action_point, "priority") + "\n", False),
+                ("Status: ", True),
+                (_enum_value(action_point, "status"), False),
+            ]
             if action_point.get("owner"):
-                p.add_run("\nOwner: ").bold = True
-                p.add_run(action_point["owner"])
+                runs += [("\nOwner: ", True), (action_point["owner"], False)]
             if action_point.get("due_date"):
-                p.add_run("\nDue Date: ").bold = True
-                p.add_run(str(action_point["due_date"]))
+                runs += [("\nDue Date: ", True), (str(action_point["due_date"]), False)]
+            _add_runs_paragraph(doc, runs)
             doc.add_paragraph()
     else:
         doc.add_paragraph("No action points.")
         doc.add_paragraph()
 
     # Rollout Strategy
-    doc.add_heading("Rollout Strategy", level=1)
-    doc.add_paragraph(data.get("rollout_strategy", "To be defined."))
-    doc.add_paragraph()
+    _add_text_section(doc, "Rollout Strategy", data.get("rollout_strategy", "To be defined."))
 
     # Footer
-    footer_section = doc.sections[0]
-    footer = footer_section.footer
-    footer_para = footer.paragraphs[0]
-    footer_para.text = f"Report generated on {_format_date(data.get('date', date.today()))}"
-    footer_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    _set_footer(doc, f"Report generated on {_format_date(data.get('date', date.today()))}")
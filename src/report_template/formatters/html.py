@@ -2,32 +2,17 @@
 HTML formatter utilities.
 """
 
-import markdown
-
-
-def render_html(markdown_text: str, include_css: bool = True) -> str:
-    """
-    Convert markdown to HTML with optional CSS styling.
+import threading
 
-    Args:
-        markdown_text: Markdown text to convert.
-        include_css: Whether to include default CSS styling.
-
-    Returns:
-        HTML string.
-    """
-    # Convert markdown to HTML
-    html_content = markdown.markdown(
-        markdown_text,
-        extensions=["tables", "fenced_code", "codehilite", "toc"],
-    )
+import markdown
 
-    if not include_css:
-        return html_content
+# Converting with a shared Markdown instance avoids loading the extensions on every
+# call. The instance keeps per-document state, so conversions are serialized.
+_MARKDOWN = markdown.Markdown(extensions=["tables", "fenced_code", "codehilite", "toc"])
+_MARKDOWN_LOCK = threading.Lock()
 
-    # Wrap with HTML document and CSS
-    css = """
-    <style>
+# Default report stylesheet, embedded in HTML reports and applied to PDFs
+DEFAULT_STYLESHEET = """
         body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;
             line-height: 1.6;
@@ -117,19 +102,46 @@ def render_html(markdown_text: str, include_css: bool = True) -> str:
         .priority-low {
             color: #95a5a6;
         }
-    </style>
+"""
+
+_CSS = f"""
+    <style>{DEFAULT_STYLESHEET}    </style>
     """
 
-    return f"""<!DOCTYPE html>
+_HTML_HEAD = f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Report</title>
-    {css}
+    {_CSS}
 </head>
 <body>
-    {html_content}
+    """
+
+_HTML_TAIL = """
 </body>
 </html>
 """
+
+
+def render_html(markdown_text: str, include_css: bool = True) -> str:
+    """
+    Convert markdown to HTML with optional CSS styling.
+
+    Args:
+        markdown_text: Markdown text to convert.
+        include_css: Whether to include default CSS styling.
+
+    Returns:
+        HTML string.
+    """
+    # Convert markdown to HTML
+    with _MARKDOWN_LOCK:
+        html_content = _MARKDOWN.reset().convert(markdown_text)
+
+    if not include_css:
+        return html_content
+
+    # Wrap with HTML document and CSS
+    return "".join((_HTML_HEAD, html_content, _HTML_TAIL))
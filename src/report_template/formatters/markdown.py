@@ -32,12 +32,9 @@ def dict_to_markdown_table(data: Dict[str, Any], headers: tuple = ("Key", "Value
     if not data:
         return ""
 
-    lines = [
-        f"| {headers[0]} | {headers[1]} |",
-        f"|{'-' * (len(headers[0]) + 2)}|{'-' * (len(headers[1]) + 2)}|",
-    ]
+    key_header, value_header = headers
+    header = f"| {key_header} | {value_header} |"
+    separator = f"|{'-' * (len(key_header) + 2)}|{'-' * (len(value_header) + 2)}|"
+    body = "\n".join(f"| {key} | {value} |" for key, value in data.items())
 
-    for key, value in data.items():
-        lines.append(f"| {key} | {value} |")
-
-    return "\n".join(lines)
+    return f"{header}\n{separator}\n{body}"
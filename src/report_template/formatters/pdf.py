@@ -2,24 +2,57 @@
 PDF formatter utilities using WeasyPrint.
 """
 
-from typing import Union
+import importlib.util
+from typing import Any, BinaryIO, Optional
 
-try:
-    from weasyprint import HTML
-    WEASYPRINT_AVAILABLE = True
-except ImportError:
-    WEASYPRINT_AVAILABLE = False
+# WeasyPrint pulls in cairo/pango at import time, so only check that it is
+# installed here and import it on first use in html_to_pdf().
+WEASYPRINT_AVAILABLE = importlib.util.find_spec("weasyprint") is not None
+
+# Font configuration shared by every conversion in this process, created on first use
+_FONT_CONFIG: Optional[Any] = None
+
+
+def _get_font_config() -> Any:
+    """Get the process-wide WeasyPrint font configuration."""
+    global _FONT_CONFIG
+    if _FONT_CONFIG is None:
+        from weasyprint.text.fonts import FontConfiguration
+
+        _FONT_CONFIG = FontConfiguration()
+    return _FONT_CONFIG
+
+
+# Default report stylesheet (see formatters.html), parsed once on first use
+_DEFAULT_CSS: Optional[Any] = None
 
 
-def html_to_pdf(html_content: str) -> bytes:
+def _get_default_stylesheet() -> Any:
+    """Get the parsed default report stylesheet."""
+    global _DEFAULT_CSS
+    if _DEFAULT_CSS is None:
+        from weasyprint import CSS
+
+        from report_template.formatters.html import DEFAULT_STYLESHEET
+
+        _DEFAULT_CSS = CSS(string=DEFAULT_STYLESHEET, font_config=_get_font_config())
+    return _DEFAULT_CSS
+
+
+def html_to_pdf(
+    html_content: str, out: Optional[BinaryIO] = None, default_css: bool = False
+) -> Optional[bytes]:
     """
     Convert HTML content to PDF.
 
     Args:
         html_content: HTML string to convert.
+        out: Optional binary stream to write the PDF to instead of returning it.
+        default_css: Whether to apply the default report stylesheet. It is parsed
+            once per process, unlike CSS embedded in html_content.
 
     Returns:
-        PDF content as bytes.
+        PDF content as bytes, or None if the PDF was written to out.
 
     Raises:
         ImportError: If WeasyPrint is not installed.
@@ -30,22 +63,28 @@ def html_to_pdf(html_content: str) -> bytes:
             "Install it with: pip install weasyprint"
         )
 
-    # Convert HTML to PDF
-    pdf_bytes = HTML(string=html_content).write_pdf()
-    return pdf_bytes
+    from weasyprint import HTML
+
+    # Convert HTML to PDF, reusing the font configuration from earlier calls
+    stylesheets = [_get_default_stylesheet()] if default_css else None
+    return HTML(string=html_content).write_pdf(
+        out, stylesheets=stylesheets, font_config=_get_font_config()
+    )
 
 
-def markdown_to_pdf(markdown_text: str) -> bytes:
+def markdown_to_pdf(markdown_text: str, out: Optional[BinaryIO] = None) -> Optional[bytes]:
     """
     Convert markdown directly to PDF.
 
     Args:
         markdown_text: Markdown text to convert.
+        out: Optional binary stream to write the PDF to instead of returning it.
 
     Returns:
-        PDF content as bytes.
+        PDF content as bytes, or None if the PDF was written to out.
     """
     from report_template.formatters.html import render_html
 
-    html_content = render_html(markdown_text, include_css=True)
-    return html_to_pdf(html_content)
+    # The stylesheet is applied as a pre-parsed object instead of inline CSS
+    html_content = render_html(markdown_text, include_css=False)
+    return html_to_pdf(html_content, out, default_css=True)
@@ -2,12 +2,21 @@
 Core report generator using Jinja2 templates.
 """
 
+import atexit
+import hashlib
 import importlib.resources
+import os
+import queue
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
-from jinja2 import Environment, FileSystemLoader, Template
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
+from pydantic import BaseModel
 
+from report_template import _json
 from report_template.models import (
     EngineeringInitReport,
     FeatureDevReport,
@@ -18,6 +27,154 @@ from report_template.models import (
 )
 
 
+# Template file extension per output format
+_FORMAT_EXT = {
+    OutputFormat.MARKDOWN: "md",
+    OutputFormat.HTML: "html",
+    OutputFormat.PDF: "html",  # PDF uses HTML template + conversion
+    OutputFormat.DOCX: None,  # DOCX doesn't use templates
+}
+
+# Default template filename for every report type and output format (None for DOCX)
+_TEMPLATE_NAMES = {
+    (report_type, output_format): f"{report_type.value}.{ext}.j2" if ext else None
+    for report_type in ReportType
+    for output_format, ext in _FORMAT_EXT.items()
+}
+
+# Output format for each recognized output file extension
+_EXT_TO_FORMAT = {
+    ".md": OutputFormat.MARKDOWN,
+    ".markdown": OutputFormat.MARKDOWN,
+    ".html": OutputFormat.HTML,
+    ".pdf": OutputFormat.PDF,
+    ".docx": OutputFormat.DOCX,
+    ".doc": OutputFormat.DOCX,
+}
+
+
+@lru_cache(maxsize=1024)
+def _format_date(d: Any) -> str:
+    """Jinja2 ``date`` filter: format a date as YYYY-MM-DD, or N/A if missing."""
+    return f"{d.year:04d}-{d.month:02d}-{d.day:02d}" if d else "N/A"
+
+
+def _format_percentage(p: Any) -> str:
+    """Jinja2 ``percentage`` filter: append a percent sign."""
+    return f"{p}%"
+
+
+def _to_plain(value: Any) -> Any:
+    """
+    Dump Pydantic models nested in a template context into plain dicts.
+
+    The DOCX builders read nested values with dict.get(), unlike templates.
+    """
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="python")
+    if isinstance(value, dict):
+        return {key: _to_plain(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_to_plain(item) for item in value]
+    return value
+
+
+# Environment variable naming a bytecode cache directory for generators created
+# without an explicit bytecode_cache_dir
+_JINJA_CACHE_ENV = "REPORT_TEMPLATE_JINJA_CACHE"
+
+# Environments shared by generators that don't add custom filters, keyed by templates
+# directory and bytecode cache directory, so each template is compiled once per process
+_ENV_CACHE: Dict[Tuple[str, Optional[str]], Environment] = {}
+_ENV_CACHE_LOCK = threading.Lock()
+
+
+def _create_environment(templates_dir: Path, bytecode_cache_dir: Optional[Path]) -> Environment:
+    """Create a Jinja2 environment for a templates directory with the default filters."""
+    # The bytecode cache is only an optimization: if the directory can't be created
+    # or written to (read-only or missing HOME, bad path), compile templates in memory
+    bytecode_cache = None
+    if bytecode_cache_dir is not None:
+        try:
+            bytecode_cache_dir.mkdir(parents=True, exist_ok=True)
+            if os.access(bytecode_cache_dir, os.W_OK):
+                bytecode_cache = FileSystemBytecodeCache(str(bytecode_cache_dir))
+        except OSError:
+            pass
+
+    env = Environment(
+        loader=FileSystemLoader(str(templates_dir)),
+        bytecode_cache=bytecode_cache,
+        trim_blocks=True,
+        lstrip_blocks=True,
+        keep_trailing_newline=True,
+        # Templates don't change while a generator is in use: skip the per-lookup
+        # mtime check and keep every compiled template for the environment's lifetime
+        auto_reload=False,
+        cache_size=-1,
+    )
+    env.filters["date"] = _format_date
+    env.filters["percentage"] = _format_percentage
+    return env
+
+
+def _get_environment(templates_dir: Path, bytecode_cache_dir: Optional[Path]) -> Environment:
+    """Get the shared environment for a templates directory, creating it on first use."""
+    key = (
+        str(templates_dir.resolve()),
+        str(bytecode_cache_dir.resolve()) if bytecode_cache_dir is not None else None,
+    )
+    with _ENV_CACHE_LOCK:
+        env = _ENV_CACHE.get(key)
+        if env is None:
+            env = _create_environment(templates_dir, bytecode_cache_dir)
+            _ENV_CACHE[key] = env
+    return env
+
+
+# Worker processes for PDF conversion, created on first use and kept until
+# shutdown_pdf_pool() is called or the interpreter exits
+_PDF_POOL: Optional[ProcessPoolExecutor] = None
+_PDF_POOL_LOCK = threading.Lock()
+
+
+def _get_pdf_pool() -> ProcessPoolExecutor:
+    """Get the shared process pool used for PDF conversion."""
+    global _PDF_POOL
+    with _PDF_POOL_LOCK:
+        if _PDF_POOL is None:
+            _PDF_POOL = ProcessPoolExecutor(max_workers=os.cpu_count())
+        return _PDF_POOL
+
+
+def shutdown_pdf_pool(wait: bool = True) -> None:
+    """
+    Shut down the worker processes used by ReportGenerator.generate_pdf_async().
+
+    The pool is created again on the next generate_pdf_async() call. Called
+    automatically when the interpreter exits.
+
+    Args:
+        wait: If True, wait for submitted conversions to finish first.
+    """
+    global _PDF_POOL
+    with _PDF_POOL_LOCK:
+        pool, _PDF_POOL = _PDF_POOL, None
+    if pool is not None:
+        pool.shutdown(wait=wait)
+
+
+atexit.register(shutdown_pdf_pool)
+
+
+def _write_pdf(html_content: str, output_path: Path) -> Path:
+    """Convert rendered HTML to PDF and write it to a file (runs in a worker process)."""
+    from report_template.formatters.pdf import html_to_pdf
+
+    ReportGenerator._write(output_path, lambda f: html_to_pdf(html_content, f))
+    return output_path
+
+
 class ReportGenerator:
     """
     Main class for generating reports from templates.
@@ -26,13 +183,29 @@ class ReportGenerator:
     and producing output in various formats.
     """
 
-    def __init__(self, templates_dir: Optional[Path] = None, custom_filters: Optional[Dict] = None):
+    def __init__(
+        self,
+        templates_dir: Optional[Path] = None,
+        custom_filters: Optional[Dict] = None,
+        background_writes: bool = False,
+        bytecode_cache_dir: Optional[Union[str, Path]] = None,
+    ):
         """
         Initialize the report generator.
 
         Args:
             templates_dir: Optional custom templates directory. If None, uses built-in templates.
             custom_filters: Optional dictionary of custom Jinja2 filters.
+            background_writes: If True, generate_to_file() renders the report and returns
+                immediately, leaving PDF conversion and the file write to a background
+                thread. Call join() to wait for pending writes.
+            bytecode_cache_dir: Optional directory for Jinja2's bytecode cache. Compiled
+                templates are stored there and reused by later processes, which skips
+                template compilation on each run. Created if it doesn't exist. Defaults
+                to the REPORT_TEMPLATE_JINJA_CACHE environment variable, if set.
+
+        Generators without custom filters share one Jinja2 environment per templates
+        directory, so templates compiled by one generator are reused by the next.
         """
         if templates_dir is None:
             # Use built-in templates
@@ -41,79 +214,92 @@ class ReportGenerator:
             templates_dir = Path(templates_dir)
 
         self.templates_dir = templates_dir
-        self.env = Environment(
-            loader=FileSystemLoader(str(templates_dir)),
-            trim_blocks=True,
-            lstrip_blocks=True,
-            keep_trailing_newline=True,
-        )
 
-        # Add custom filters
-        self._setup_filters(custom_filters or {})
+        if bytecode_cache_dir is None:
+            bytecode_cache_dir = os.environ.get(_JINJA_CACHE_ENV) or None
+        if bytecode_cache_dir is not None:
+            bytecode_cache_dir = Path(bytecode_cache_dir)
 
-    def _setup_filters(self, custom_filters: Dict) -> None:
-        """Set up Jinja2 filters."""
-        # Default filters
-        self.env.filters["date"] = lambda d: d.strftime("%Y-%m-%d") if d else "N/A"
-        self.env.filters["percentage"] = lambda p: f"{p}%"
+        # Custom filters must not leak into other generators, and templates compiled in
+        # a shared environment would be bound to its filters, so those get their own
+        if custom_filters:
+            self.env = _create_environment(templates_dir, bytecode_cache_dir)
+            self._setup_filters(custom_filters)
+        else:
+            self.env = _get_environment(templates_dir, bytecode_cache_dir)
+        self._templates: Dict[str, Template] = {}
+
+        # Background writer state, the thread is started on first use
+        self.background_writes = background_writes
+        self._write_queue: "queue.Queue[Callable[[], None]]" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        self._write_errors: List[BaseException] = []
 
-        # Add custom filters
+    def _setup_filters(self, custom_filters: Dict) -> None:
+        """Add custom Jinja2 filters on top of the default ones."""
         for name, func in custom_filters.items():
             self.env.filters[name] = func
 
     def _get_template_name(self, report_type: ReportType, output_format: OutputFormat) -> str:
         """Get the template filename for a report type and format."""
-        format_ext = {
-            OutputFormat.MARKDOWN: "md",
-            OutputFormat.HTML: "html",
-            OutputFormat.PDF: "html",  # PDF uses HTML template + conversion
-            OutputFormat.DOCX: None,  # DOCX doesn't use templates
-        }
-
-        ext = format_ext[output_format]
-        if ext is None:
-            return None
-        return f"{report_type.value}.{ext}.j2"
+        return _TEMPLATE_NAMES[report_type, output_format]
+
+    def _get_template(self, template_name: str) -> Template:
+        """Get a compiled template, loading it only on first use."""
+        template = self._templates.get(template_name)
+        if template is None:
+            template = self.env.get_template(template_name)
+            self._templates[template_name] = template
+        return template
+
+    def _build_context(self, report_data: Union[ReportData, Dict[str, Any]]) -> Dict[str, Any]:
+        """Convert report data into the dictionary passed to templates and formatters."""
+        # Templates read nested values by attribute, which works on Pydantic models as
+        # well as dicts, so use the model's fields as they are instead of recursively
+        # dumping every task, milestone and team member into new dicts
+        if isinstance(report_data, ReportData):
+            return dict(report_data.__dict__)
+        return report_data
 
-    def generate(
+    def _render(
         self,
-        report_data: Union[ReportData, Dict[str, Any]],
+        data_dict: Dict[str, Any],
         report_type: ReportType,
-        output_format: OutputFormat = OutputFormat.MARKDOWN,
+        output_format: OutputFormat,
         template_name: Optional[str] = None,
+        rendered_cache: Optional[Dict[str, str]] = None,
     ) -> Union[str, bytes]:
         """
-        Generate a report from data.
+        Render an already built context dictionary into the requested format.
 
         Args:
-            report_data: Report data as a Pydantic model or dictionary.
+            data_dict: Template context built by _build_context().
             report_type: Type of report to generate.
             output_format: Desired output format.
             template_name: Optional custom template name. If None, uses default for report_type.
+            rendered_cache: Optional dictionary of template output keyed by template name,
+                used to share one render between formats built from the same template.
 
         Returns:
             Rendered report as a string (for text formats) or bytes (for binary formats).
         """
-        # Convert Pydantic model to dict if needed
-        if isinstance(report_data, ReportData):
-            data_dict = report_data.model_dump(mode="python")
-        else:
-            data_dict = report_data
-
         # Handle DOCX format separately (doesn't use templates)
         if output_format == OutputFormat.DOCX:
             from report_template.formatters.docx import create_docx_report
 
-            return create_docx_report(data_dict, report_type.value)
+            return create_docx_report(_to_plain(data_dict), report_type.value)
 
         # Load template
         if template_name is None:
             template_name = self._get_template_name(report_type, output_format)
 
-        template = self.env.get_template(template_name)
-
         # Render
-        rendered = template.render(**data_dict)
+        if rendered_cache is not None and template_name in rendered_cache:
+            rendered = rendered_cache[template_name]
+        else:
+            rendered = self._get_template(template_name).render(**data_dict)
+            if rendered_cache is not None:
+                rendered_cache[template_name] = rendered
 
         # Post-process for PDF if needed
         if output_format == OutputFormat.PDF:
@@ -123,6 +309,96 @@ class ReportGenerator:
 
         return rendered
 
+    def generate(
+        self,
+        report_data: Union[ReportData, Dict[str, Any]],
+        report_type: ReportType,
+        output_format: OutputFormat = OutputFormat.MARKDOWN,
+        template_name: Optional[str] = None,
+    ) -> Union[str, bytes]:
+        """
+        Generate a report from data.
+
+        Args:
+            report_data: Report data as a Pydantic model or dictionary.
+            report_type: Type of report to generate.
+            output_format: Desired output format.
+            template_name: Optional custom template name. If None, uses default for report_type.
+
+        Returns:
+            Rendered report as a string (for text formats) or bytes (for binary formats).
+        """
+        data_dict = self._build_context(report_data)
+        return self._render(data_dict, report_type, output_format, template_name)
+
+    @staticmethod
+    def _infer_format(output_path: Path) -> OutputFormat:
+        """Infer the output format from a file extension, defaulting to Markdown."""
+        return _EXT_TO_FORMAT.get(output_path.suffix.lower(), OutputFormat.MARKDOWN)
+
+    @staticmethod
+    def _write(
+        output_path: Path,
+        content: Union[str, bytes, Iterable[str], Callable[[BinaryIO], Any]],
+    ) -> None:
+        """
+        Write rendered report content to a file.
+
+        Text is encoded as UTF-8 and written in binary mode. Content may also be an
+        iterable of text chunks (e.g. from Template.generate()), which is written as
+        it is produced, or a callable that writes binary content (DOCX, PDF) to the
+        open file itself. The content goes to a temporary sibling file first and is
+        moved into place, so an interrupted write never leaves a truncated report behind.
+        """
+        tmp_path = output_path.with_suffix(output_path.suffix + ".tmp")
+        try:
+            with open(tmp_path, "wb", buffering=1 << 16) as f:
+                ReportGenerator._write_content(f, content)
+            os.replace(tmp_path, output_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    @staticmethod
+    def _write_content(
+        fp: BinaryIO,
+        content: Union[str, bytes, Iterable[str], Callable[[BinaryIO], Any]],
+    ) -> None:
+        """Write report content, in any form _write() accepts, to an open binary file."""
+        if callable(content):
+            content(fp)
+            return
+        chunks = (content,) if isinstance(content, (str, bytes)) else content
+        for chunk in chunks:
+            fp.write(chunk.encode("utf-8") if isinstance(chunk, str) else chunk)
+
+    def _cache_key(
+        self,
+        report_data: Union[ReportData, Dict[str, Any]],
+        report_type: ReportType,
+        output_format: OutputFormat,
+        template_name: Optional[str] = None,
+    ) -> str:
+        """
+        Hash the inputs that determine a generated file.
+
+        These are the report data, report type, output format and template.
+        """
+        if isinstance(report_data, ReportData):
+            payload = report_data.model_dump_json().encode("utf-8")
+        else:
+            payload = _json.dumps(report_data, sort_keys=True)
+
+        digest = hashlib.blake2b(payload, digest_size=16)
+        digest.update(f"{report_type.value}:{output_format.value}".encode("utf-8"))
+
+        if output_format != OutputFormat.DOCX:
+            if template_name is None:
+                template_name = self._get_template_name(report_type, output_format)
+            digest.update((self.templates_dir / template_name).read_bytes())
+
+        return digest.hexdigest()
+
     def generate_to_file(
         self,
         report_data: Union[ReportData, Dict[str, Any]],
@@ -130,6 +406,7 @@ class ReportGenerator:
         output_path: Union[str, Path],
         output_format: Optional[OutputFormat] = None,
         template_name: Optional[str] = None,
+        skip_unchanged: bool = False,
     ) -> Path:
         """
         Generate a report and save it to a file.
@@ -140,6 +417,9 @@ class ReportGenerator:
             output_path: Path where the report should be saved.
             output_format: Desired output format. If None, inferred from output_path extension.
             template_name: Optional custom template name.
+            skip_unchanged: If True, store a hash of the inputs in a ``.cachekey`` file next to
+                the output and skip rendering when the data and template have not changed
+                since the file was last generated.
 
         Returns:
             Path to the generated file.
@@ -148,40 +428,283 @@ class ReportGenerator:
 
         # Infer format from extension if not provided
         if output_format is None:
-            ext_to_format = {
-                ".md": OutputFormat.MARKDOWN,
-                ".markdown": OutputFormat.MARKDOWN,
-                ".html": OutputFormat.HTML,
-                ".pdf": OutputFormat.PDF,
-                ".docx": OutputFormat.DOCX,
-                ".doc": OutputFormat.DOCX,
-            }
-            output_format = ext_to_format.get(
-                output_path.suffix.lower(), OutputFormat.MARKDOWN
+            output_format = self._infer_format(output_path)
+
+        # Reuse the existing file if it was generated from identical inputs
+        cache_key = None
+        if skip_unchanged:
+            cache_key = self._cache_key(report_data, report_type, output_format, template_name)
+            key_path = output_path.with_suffix(output_path.suffix + ".cachekey")
+            if (
+                output_path.exists()
+                and key_path.exists()
+                and key_path.read_text(encoding="utf-8") == cache_key
+            ):
+                return output_path
+
+        if self.background_writes:
+            self._submit_write(
+                self._prepare_write(
+                    report_data, report_type, output_path, output_format, template_name, cache_key
+                )
             )
+            return output_path
 
-        # Generate report
-        content = self.generate(report_data, report_type, output_format, template_name)
+        # Generate report. Text formats are streamed to disk as the template renders
+        # instead of being built up as one string first, and DOCX/PDF documents are
+        # saved straight into the file rather than returned as bytes.
+        content = self._file_content(report_data, report_type, output_format, template_name)
 
         # Write to file
-        mode = "wb" if output_format in [OutputFormat.PDF, OutputFormat.DOCX] else "w"
-        with open(output_path, mode) as f:
-            if isinstance(content, bytes):
-                f.write(content)
-            else:
-                f.write(content)
+        self._write(output_path, content)
+        if cache_key is not None:
+            key_path.write_text(cache_key, encoding="utf-8")
 
         return output_path
 
+    def generate_stream(
+        self,
+        report_data: Union[ReportData, Dict[str, Any]],
+        report_type: ReportType,
+        fp: BinaryIO,
+        output_format: OutputFormat = OutputFormat.MARKDOWN,
+        template_name: Optional[str] = None,
+    ) -> None:
+        """
+        Generate a report and write it to an open binary file as it is produced.
+
+        Text formats are written as UTF-8 chunk by chunk while the template renders, and
+        DOCX/PDF documents are saved straight into fp, so the whole report is never held
+        in memory at once.
+
+        Args:
+            report_data: Report data as a Pydantic model or dictionary.
+            report_type: Type of report to generate.
+            fp: File object opened in binary mode (e.g. ``open(path, "wb")`` or ``BytesIO``).
+            output_format: Desired output format.
+            template_name: Optional custom template name. If None, uses default for report_type.
+        """
+        content = self._file_content(report_data, report_type, output_format, template_name)
+        self._write_content(fp, content)
+
+    def _file_content(
+        self,
+        report_data: Union[ReportData, Dict[str, Any]],
+        report_type: ReportType,
+        output_format: OutputFormat,
+        template_name: Optional[str],
+    ) -> Union[Iterable[str], Callable[[BinaryIO], Any]]:
+        """Produce report content in the form _write() can stream into the output file."""
+        if output_format == OutputFormat.DOCX:
+            from report_template.formatters.docx import create_docx_report
+
+            data_dict = _to_plain(self._build_context(report_data))
+            return lambda f: create_docx_report(data_dict, report_type.value, out=f)
+
+        if output_format == OutputFormat.PDF:
+            from report_template.formatters.pdf import html_to_pdf
+
+            html_content = self.generate(report_data, report_type, OutputFormat.HTML, template_name)
+            return lambda f: html_to_pdf(html_content, f)
+
+        if template_name is None:
+            template_name = self._get_template_name(report_type, output_format)
+        return self._get_template(template_name).generate(**self._build_context(report_data))
+
+    def _prepare_write(
+        self,
+        report_data: Union[ReportData, Dict[str, Any]],
+        report_type: ReportType,
+        output_path: Path,
+        output_format: OutputFormat,
+        template_name: Optional[str],
+        cache_key: Optional[str],
+    ) -> Callable[[], None]:
+        """
+        Render a report now and return a job that finishes it on the writer thread.
+
+        Rendering happens in the calling thread so later changes to report_data don't
+        leak into the output. PDF reports are rendered to HTML here and converted by the job.
+        """
+        if output_format == OutputFormat.PDF:
+            html_content = self.generate(report_data, report_type, OutputFormat.HTML, template_name)
+
+            def write_pdf(f: BinaryIO) -> None:
+                from report_template.formatters.pdf import html_to_pdf
+
+                html_to_pdf(html_content, f)
+
+            content: Union[str, bytes, Callable[[BinaryIO], Any]] = write_pdf
+        else:
+            content = self.generate(report_data, report_type, output_format, template_name)
+
+        def job() -> None:
+            self._write(output_path, content)
+            if cache_key is not None:
+                key_path = output_path.with_suffix(output_path.suffix + ".cachekey")
+                key_path.write_text(cache_key, encoding="utf-8")
+
+        return job
+
+    def _submit_write(self, job: Callable[[], None]) -> None:
+        """Queue a job for the background writer thread, starting it if needed."""
+        if self._writer is None:
+            self._writer = threading.Thread(
+                target=self._drain, name="report-writer", daemon=True
+            )
+            self._writer.start()
+        self._write_queue.put(job)
+
+    def _drain(self) -> None:
+        """Run queued write jobs until the process exits (background writer thread)."""
+        while True:
+            job = self._write_queue.get()
+            try:
+                job()
+            except BaseException as e:  # reported to the caller by join()
+                self._write_errors.append(e)
+            finally:
+                self._write_queue.task_done()
+
+    def join(self) -> None:
+        """
+        Wait for all background writes to finish.
+
+        Raises:
+            Exception: The first error raised by a background write since the last join().
+        """
+        self._write_queue.join()
+        if self._write_errors:
+            error = self._write_errors[0]
+            self._write_errors.clear()
+            raise error
+
+    def generate_all(
+        self,
+        report_data: Union[ReportData, Dict[str, Any]],
+        outputs: Iterable[Tuple[ReportType, Union[str, Path]]],
+    ) -> List[Path]:
+        """
+        Generate several output files from the same report data.
+
+        The template context is built once and shared by every output, and
+        formats rendered from the same template (HTML and PDF) share a single
+        template render.
+
+        Args:
+            report_data: Report data as a Pydantic model or dictionary.
+            outputs: Pairs of (report type, output path). The format of each
+                output is inferred from its file extension.
+
+        Returns:
+            Paths to the generated files, in the order given.
+        """
+        data_dict = self._build_context(report_data)
+        rendered_cache: Dict[str, str] = {}
+
+        paths = []
+        for report_type, output_path in outputs:
+            output_path = Path(output_path)
+            output_format = self._infer_format(output_path)
+            content = self._render(
+                data_dict, report_type, output_format, rendered_cache=rendered_cache
+            )
+            self._write(output_path, content)
+            paths.append(output_path)
+
+        return paths
+
+    def generate_many(
+        self,
+        reports: Iterable[Union[ReportData, Dict[str, Any]]],
+        report_type: ReportType,
+        output_format: OutputFormat = OutputFormat.MARKDOWN,
+        template_name: Optional[str] = None,
+    ) -> Iterator[Union[str, bytes]]:
+        """
+        Render the same report type and template for many reports, one at a time.
+
+        The template is resolved and compiled once up front, so each report only
+        costs its own render. Reports are rendered lazily as the result is iterated.
+
+        Args:
+            reports: Report data items as Pydantic models or dictionaries.
+            report_type: Type of report to generate.
+            output_format: Desired output format.
+            template_name: Optional custom template name. If None, uses default for report_type.
+
+        Yields:
+            Each rendered report as a string (for text formats) or bytes (for binary formats),
+            in the order given.
+        """
+        if template_name is None:
+            template_name = self._get_template_name(report_type, output_format)
+        if template_name is not None:
+            self._get_template(template_name)
+
+        for report_data in reports:
+            data_dict = self._build_context(report_data)
+            yield self._render(data_dict, report_type, output_format, template_name)
+
+    def generate_pdf_async(
+        self,
+        report_data: Union[ReportData, Dict[str, Any]],
+        report_type: ReportType,
+        output_path: Union[str, Path],
+        template_name: Optional[str] = None,
+    ) -> "Future[Path]":
+        """
+        Generate a PDF report in a background worker process.
+
+        The HTML is rendered in the calling process and only the resulting string is
+        sent to the worker, which runs the CPU-heavy WeasyPrint conversion outside the
+        caller's GIL. Several PDFs submitted this way are converted in parallel.
+
+        The worker processes are shared by all generators and stay alive after the
+        conversion, so later calls don't pay the process startup cost. Call
+        shutdown_pdf_pool() to stop them early; they are shut down at interpreter exit.
+
+        Args:
+            report_data: Report data as a Pydantic model or dictionary.
+            report_type: Type of report to generate.
+            output_path: Path where the PDF should be saved.
+            template_name: Optional custom HTML template name.
+
+        Returns:
+            Future resolving to the path of the generated file.
+        """
+        html_content = self.generate(report_data, report_type, OutputFormat.HTML, template_name)
+        return self.html_to_pdf_async(html_content, output_path)
+
+    @staticmethod
+    def html_to_pdf_async(html_content: str, output_path: Union[str, Path]) -> "Future[Path]":
+        """
+        Convert already rendered HTML to a PDF file in a background worker process.
+
+        Use this instead of generate_pdf_async() when the HTML report is also needed
+        on its own, so the template is rendered only once. Uses the same worker pool.
+
+        Args:
+            html_content: Rendered HTML report.
+            output_path: Path where the PDF should be saved.
+
+        Returns:
+            Future resolving to the path of the generated file.
+        """
+        return _get_pdf_pool().submit(_write_pdf, html_content, Path(output_path))
+
     def list_templates(self) -> Dict[str, list]:
         """List available templates by report type."""
+        # One directory scan instead of a stat() per report type and format
+        with os.scandir(self.templates_dir) as entries:
+            existing = {entry.name for entry in entries if entry.is_file()}
+
         templates = {}
         for report_type in ReportType:
-            templates[report_type.value] = []
-            for output_format in OutputFormat:
-                template_name = self._get_template_name(report_type, output_format)
-                template_path = self.templates_dir / template_name
-                if template_path.exists():
-                    templates[report_type.value].append(template_name)
+            # PDF shares the HTML template and DOCX has none, so list each file once
+            names = dict.fromkeys(
+                _TEMPLATE_NAMES[report_type, output_format] for output_format in OutputFormat
+            )
+            templates[report_type.value] = [name for name in names if name in existing]
 
         return templates
@@ -2,11 +2,80 @@
 JIRA integration module for fetching task data from JIRA server.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 import requests
-
-from report_template.models import Priority, Status
+from urllib3.util.retry import Retry
+
+from report_template.enums import Priority, Status
+
+# Issue fields read by JiraClient.issue_to_task_data()
+_TASK_FIELDS = [
+    'summary',
+    'description',
+    'status',
+    'priority',
+    'assignee',
+    'created',
+    'labels',
+    'customfield_31590',
+    'customfield_31591',
+]
+
+# Maximum number of issues the search API returns per request
+_SEARCH_PAGE_SIZE = 100
+
+# Default number of issues sync_tasks() fetches concurrently
+_SYNC_WORKERS = 10
+
+# Connections kept open per host; at least as many as concurrent fetches
+# (sync_tasks() and the CLI's fetch-tickets use up to 16 threads)
+_POOL_SIZE = 20
+
+# Lowercase JIRA status and priority names mapped to Status/Priority values.
+# Unlisted names map to NOT_STARTED and LOW respectively.
+_STATUS_MAP = {
+    'done': Status.COMPLETED.value,
+    'closed': Status.COMPLETED.value,
+    'resolved': Status.COMPLETED.value,
+    'completed': Status.COMPLETED.value,
+    'in progress': Status.IN_PROGRESS.value,
+    'in development': Status.IN_PROGRESS.value,
+    'in review': Status.IN_PROGRESS.value,
+    'blocked': Status.BLOCKED.value,
+    'impediment': Status.BLOCKED.value,
+    'on hold': Status.ON_HOLD.value,
+    'paused': Status.ON_HOLD.value,
+}
+
+_PRIORITY_MAP = {
+    'highest': Priority.CRITICAL.value,
+    'critical': Priority.CRITICAL.value,
+    'blocker': Priority.CRITICAL.value,
+    'high': Priority.HIGH.value,
+    'medium': Priority.MEDIUM.value,
+    'normal': Priority.MEDIUM.value,
+}
+
+
+def _iter_adf_text(nodes: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """Yield the text of the text nodes in top-level ADF paragraphs."""
+    for node in nodes:
+        if node.get('type') == 'paragraph':
+            for child in node.get('content', ()):
+                if child.get('type') == 'text':
+                    yield child.get('text', '')
+
+
+def _quote_jql(value: str) -> str:
+    """Quote a string literal for use in a JQL query."""
+    escaped = value.replace('\\', '\\\\').replace('"', '\\"')
+    return f'"{escaped}"'
+
+
+class JiraError(Exception):
+    """Raised when a JIRA API request fails."""
 
 
 class JiraClient:
@@ -31,6 +100,34 @@ class JiraClient:
             "Content-Type": "application/json"
         }
 
+        # One session for all requests, so calls reuse keep-alive connections instead
+        # of doing a new TCP/TLS handshake each time. Rate limiting and transient server
+        # errors are retried with backoff; POST is only used for read-only searches.
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset({"GET", "POST"}),
+            raise_on_status=False,
+        )
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=_POOL_SIZE, pool_maxsize=_POOL_SIZE, max_retries=retry
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and its connections."""
+        self._session.close()
+
+    def __enter__(self) -> "JiraClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
     def get_issue(self, issue_key: str) -> Dict[str, Any]:
         """
         Fetch a JIRA issue by key.
@@ -42,26 +139,78 @@ class JiraClient:
             Dictionary with issue data
 
         Raises:
-            Exception: If issue not found or API error
+            JiraError: If issue not found or API error
         """
         api_url = f"{self.url}/rest/api/2/issue/{issue_key}?fields=*all"
 
         try:
-            response = requests.get(api_url, headers=self.headers, timeout=30)
+            response = self._session.get(api_url, timeout=30)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 403:
-                raise Exception(
+                raise JiraError(
                     f"Access denied to JIRA issue {issue_key}. "
                     "Check your Personal Access Token (PAT) permissions."
                 ) from e
             elif e.response.status_code == 404:
-                raise Exception(f"JIRA issue {issue_key} not found.") from e
+                raise JiraError(f"JIRA issue {issue_key} not found.") from e
             else:
-                raise Exception(f"Failed to fetch JIRA issue {issue_key}: {str(e)}") from e
+                raise JiraError(f"Failed to fetch JIRA issue {issue_key}: {str(e)}") from e
+        except requests.exceptions.RequestException as e:
+            raise JiraError(f"Failed to connect to JIRA: {str(e)}") from e
+
+    def get_issues_bulk(
+        self, issue_keys: List[str], max_workers: int = _SYNC_WORKERS
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch several JIRA issues with as few requests as possible.
+
+        Issues are looked up through the search API with a ``key in (...)`` JQL
+        query, up to 100 keys per request, and only the fields needed by
+        issue_to_task_data() are requested. When there are more than 100 keys,
+        the searches run concurrently.
+
+        Args:
+            issue_keys: JIRA issue keys (e.g., ['PROJ-123', 'PROJ-124'])
+            max_workers: Maximum number of searches sent at the same time.
+
+        Returns:
+            Dictionary mapping issue key to issue data. Keys that don't exist or
+            aren't visible to the token are missing from the result.
+
+        Raises:
+            JiraError: If API error occurs
+        """
+        chunks = [
+            issue_keys[start:start + _SEARCH_PAGE_SIZE]
+            for start in range(0, len(issue_keys), _SEARCH_PAGE_SIZE)
+        ]
+        if len(chunks) > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+                pages = list(executor.map(self._search_issues, chunks))
+        else:
+            pages = [self._search_issues(chunk) for chunk in chunks]
+
+        return {issue['key']: issue for page in pages for issue in page}
+
+    def _search_issues(self, keys: List[str]) -> List[Dict[str, Any]]:
+        """Run one search for up to 100 issue keys and return the issues found."""
+        api_url = f"{self.url}/rest/api/2/search"
+        payload = {
+            'jql': f"key in ({', '.join(_quote_jql(key) for key in keys)})",
+            'fields': _TASK_FIELDS,
+            'maxResults': len(keys),
+            # Report unknown keys as warnings instead of failing the whole query
+            'validateQuery': 'warn',
+        }
+
+        try:
+            response = self._session.post(api_url, json=payload, timeout=30)
+            response.raise_for_status()
+            return response.json().get('issues', [])
         except requests.exceptions.RequestException as e:
-            raise Exception(f"Failed to connect to JIRA: {str(e)}") from e
+            raise JiraError(f"Failed to search JIRA issues: {str(e)}") from e
 
     def issue_to_task_data(self, issue: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -128,14 +277,8 @@ class JiraClient:
         # Handle Atlassian Document Format (ADF)
         if isinstance(description, dict):
             # Simple text extraction from ADF
-            content = description.get('content', [])
-            text_parts = []
-            for node in content:
-                if node.get('type') == 'paragraph':
-                    for child in node.get('content', []):
-                        if child.get('type') == 'text':
-                            text_parts.append(child.get('text', ''))
-            return ' '.join(text_parts) if text_parts else None
+            text = ' '.join(_iter_adf_text(description.get('content', ())))
+            return text or None
 
         return str(description)
 
@@ -165,18 +308,7 @@ class JiraClient:
         Returns:
             Status enum value as string
         """
-        status_lower = jira_status.lower()
-
-        if status_lower in ['done', 'closed', 'resolved', 'completed']:
-            return Status.COMPLETED.value
-        elif status_lower in ['in progress', 'in development', 'in review']:
-            return Status.IN_PROGRESS.value
-        elif status_lower in ['blocked', 'impediment']:
-            return Status.BLOCKED.value
-        elif status_lower in ['on hold', 'paused']:
-            return Status.ON_HOLD.value
-        else:
-            return Status.NOT_STARTED.value
+        return _STATUS_MAP.get(jira_status.lower(), Status.NOT_STARTED.value)
 
     def _map_priority(self, jira_priority: str) -> str:
         """
@@ -188,28 +320,25 @@ class JiraClient:
         Returns:
             Priority enum value as string
         """
-        priority_lower = jira_priority.lower()
-
-        if priority_lower in ['highest', 'critical', 'blocker']:
-            return Priority.CRITICAL.value
-        elif priority_lower in ['high']:
-            return Priority.HIGH.value
-        elif priority_lower in ['medium', 'normal']:
-            return Priority.MEDIUM.value
-        else:
-            return Priority.LOW.value
+        return _PRIORITY_MAP.get(jira_priority.lower(), Priority.LOW.value)
 
-    def sync_tasks(self, task_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def sync_tasks(
+        self, task_list: List[Dict[str, Any]], max_workers: int = _SYNC_WORKERS
+    ) -> List[Dict[str, Any]]:
         """
         Sync task data with JIRA for tasks that have jira_id.
 
         This method allows you to create minimal tasks with just jira_id,
         and all other fields will be automatically fetched from JIRA.
+        Issues are fetched with bulk searches (up to 100 per request); issues the
+        search doesn't return are fetched one by one, concurrently, so each failure
+        gets its own message. Tasks are merged and reported in order.
 
         Args:
             task_list: List of task dictionaries. Each task can be minimal:
                        {"jira_id": "PROJ-123"}
                        Or have additional local overrides.
+            max_workers: Maximum number of requests sent at the same time.
 
         Returns:
             Updated list of task dictionaries with JIRA data
@@ -228,17 +357,38 @@ class JiraClient:
                     priority: High
                     # ... all other fields from JIRA
         """
-        updated_tasks = []
+        jira_ids = [task.get('jira_id') for task in task_list]
+        # Each distinct issue is fetched once, even if several tasks link to it
+        linked_ids = list(dict.fromkeys(jira_id for jira_id in jira_ids if jira_id))
 
-        for task in task_list:
-            jira_id = task.get('jira_id')
+        issues: Dict[str, Dict[str, Any]] = {}
+        if linked_ids:
+            try:
+                issues = self.get_issues_bulk(linked_ids, max_workers=max_workers)
+            except JiraError as e:
+                print(f"Bulk fetch failed, fetching issues individually: {str(e)}")
 
-            if jira_id:
-                try:
-                    # Fetch from JIRA
-                    issue = self.get_issue(jira_id)
-                    jira_data = self.issue_to_task_data(issue)
+        def fetch(jira_id: str) -> Any:
+            # Return the error instead of raising so one failed issue doesn't stop the rest
+            try:
+                issue = issues.get(jira_id) or self.get_issue(jira_id)
+                return self.issue_to_task_data(issue)
+            except (JiraError, AttributeError) as e:  # AttributeError: null issue fields
+                return e
+
+        results: Dict[str, Any] = {}
+        if linked_ids:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(linked_ids))) as executor:
+                results = dict(zip(linked_ids, executor.map(fetch, linked_ids)))
+
+        updated_tasks = []
 
+        for task, jira_id in zip(task_list, jira_ids):
+            if jira_id:
+                jira_data = results[jira_id]
+                if isinstance(jira_data, Exception):
+                    print(f"✗ Failed to sync {jira_id}: {str(jira_data)}")
+                else:
                     # Merge JIRA data with existing task data
                     # JIRA data overwrites local data if JIRA has a value
                     for key, value in jira_data.items():
@@ -246,12 +396,7 @@ class JiraClient:
                             task[key] = value
 
                     print(f"✓ Synced {jira_id}: {task.get('title', 'Unknown')}")
-
-                except Exception as e:
-                    print(f"✗ Failed to sync {jira_id}: {str(e)}")
-            else:
-                # Task without jira_id - keep as is
-                pass
+            # Tasks without jira_id are kept as is
 
             updated_tasks.append(task)
 
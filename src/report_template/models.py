@@ -5,46 +5,27 @@ Data models for different report types using Pydantic for validation.
 from __future__ import annotations
 
 from datetime import date as date_type, datetime
-from enum import Enum
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+from report_template.enums import OutputFormat, Priority, ReportType, Status
 
-class ReportType(str, Enum):
-    """Supported report types."""
-
-    FEATURE_DEV = "feature_dev"
-    PROGRAM_MGMT = "program_mgmt"
-    ENGINEERING_INIT = "engineering_init"
-
-
-class OutputFormat(str, Enum):
-    """Supported output formats."""
-
-    MARKDOWN = "markdown"
-    HTML = "html"
-    PDF = "pdf"
-    DOCX = "docx"
-
-
-class Status(str, Enum):
-    """Project/task status options."""
-
-    NOT_STARTED = "Not Started"
-    IN_PROGRESS = "In Progress"
-    COMPLETED = "Completed"
-    BLOCKED = "Blocked"
-    ON_HOLD = "On Hold"
-
-
-class Priority(str, Enum):
-    """Priority levels."""
-
-    LOW = "Low"
-    MEDIUM = "Medium"
-    HIGH = "High"
-    CRITICAL = "Critical"
+# The enums are re-exported so models can be used without importing enums
+__all__ = [
+    "OutputFormat",
+    "Priority",
+    "ReportType",
+    "Status",
+    "Milestone",
+    "Task",
+    "TeamMember",
+    "ActionPoints",
+    "ReportData",
+    "FeatureDevReport",
+    "ProgramMgmtReport",
+    "EngineeringInitReport",
+]
 
 
 class Milestone(BaseModel):
@@ -74,6 +55,8 @@ class Task(BaseModel):
 class TeamMember(BaseModel):
     """Represents a team member."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str
     role: str
     email: Optional[str] = None
@@ -105,10 +88,16 @@ class ReportData(BaseModel):
     @classmethod
     def parse_date(cls, v: Any) -> date_type:
         """Parse date from various formats."""
-        if isinstance(v, date_type):
+        # Common cases first: date objects are kept, and plain "YYYY-MM-DD" strings
+        # are left to Pydantic's own (compiled) date parsing
+        if v.__class__ is date_type:
+            return v
+        if isinstance(v, str) and len(v) == 10 and v[4] == "-" and v[7] == "-":
             return v
         if isinstance(v, datetime):
             return v.date()
+        if isinstance(v, date_type):
+            return v
         if isinstance(v, str):
             return datetime.fromisoformat(v).date()
         return v
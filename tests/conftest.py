@@ -0,0 +1,25 @@
+"""Shared pytest fixtures."""
+
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from report_template.generator import ReportGenerator
+
+
+@pytest.fixture(scope="session")
+def generator():
+    """Create a ReportGenerator instance shared by all tests.
+
+    Compiled templates are kept in a bytecode cache in the temp directory, so later
+    test runs load them from disk instead of compiling them again. The default
+    templates are loaded up front so tests only pay for rendering.
+    """
+    gen = ReportGenerator(
+        bytecode_cache_dir=Path(tempfile.gettempdir()) / "report-template-tests-jinja"
+    )
+    for template_names in gen.list_templates().values():
+        for template_name in template_names:
+            gen._get_template(template_name)
+    return gen
@@ -0,0 +1,81 @@
+"""Tests for the JIRA commands of the CLI, with the JIRA HTTP session mocked."""
+
+from unittest import mock
+
+import pytest
+import requests
+from click.testing import CliRunner
+
+from report_template import _yaml, cli
+from report_template.jira_client import JiraClient
+
+from tests.test_jira_client import _get_issue_returning, _issue, _search_returning
+
+
+@pytest.fixture
+def jira_client(monkeypatch):
+    """JiraClient with a mocked HTTP session, used by the CLI instead of a real one."""
+    client = JiraClient("https://jira.example.com", "token")
+    client._session = mock.Mock()
+    monkeypatch.setattr(cli, "_connect_jira", lambda config: client)
+    return client
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    """Placeholder config file; the connection itself is mocked."""
+    path = tmp_path / ".jira.config.yaml"
+    path.write_text("jira: {}\n")
+    return str(path)
+
+
+def _fetch_tickets(config_file, output, *jira_ids):
+    """Run fetch-tickets and return the result and the saved task titles."""
+    result = CliRunner().invoke(
+        cli.main, ["fetch-tickets", *jira_ids, "--config", config_file, "-o", str(output)]
+    )
+    assert result.exit_code == 0, result.output
+    tasks = _yaml.safe_load(output.read_bytes())["tasks"]
+    return result, [task["title"] for task in tasks]
+
+
+def test_fetch_tickets_keeps_order(jira_client, config_file, tmp_path):
+    """Test that tickets are saved in the order given, with missing ones fetched singly."""
+    jira_client._session.post.side_effect = _search_returning({"PROJ-3", "PROJ-1"})
+    jira_client._session.get.side_effect = _get_issue_returning({"PROJ-2"})
+
+    result, titles = _fetch_tickets(
+        config_file, tmp_path / "tasks.yaml", "PROJ-3", "PROJ-2", "PROJ-1", "PROJ-9"
+    )
+
+    assert titles == ["Summary PROJ-3", "Summary PROJ-2", "Summary PROJ-1"]
+    assert "Failed to fetch PROJ-9" in result.output
+    assert jira_client._session.get.call_count == 2
+
+
+def test_fetch_tickets_falls_back_when_search_fails(jira_client, config_file, tmp_path):
+    """Test that every ticket is fetched individually when the bulk search fails."""
+    jira_client._session.post.side_effect = requests.ConnectionError("search unavailable")
+    jira_client._session.get.side_effect = _get_issue_returning({"PROJ-1", "PROJ-2"})
+
+    result, titles = _fetch_tickets(config_file, tmp_path / "tasks.yaml", "PROJ-2", "PROJ-1")
+
+    assert titles == ["Summary PROJ-2", "Summary PROJ-1"]
+    assert "Bulk fetch failed" in result.output
+
+
+def test_sync_jira_without_changes_keeps_file(jira_client, config_file, tmp_path):
+    """Test that sync-jira doesn't rewrite the data file when JIRA has no new data."""
+    jira_client._session.post.side_effect = _search_returning({"PROJ-1"})
+    data_path = tmp_path / "data.yaml"
+    task = jira_client.issue_to_task_data(_issue("PROJ-1"))
+    data_path.write_bytes(b"# Local comment\n")
+    with open(data_path, "a", encoding="utf-8") as f:
+        _yaml.safe_dump({"tasks": [task]}, f)
+    original = data_path.read_bytes()
+
+    result = CliRunner().invoke(cli.main, ["sync-jira", str(data_path), "--config", config_file])
+
+    assert result.exit_code == 0, result.output
+    assert "No changes." in result.output
+    assert data_path.read_bytes() == original
@@ -0,0 +1,130 @@
+"""Tests for the Confluence client, with the HTTP session mocked."""
+
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+import requests
+
+from report_template import _json
+from report_template import confluence_client as confluence_module
+from report_template.confluence_client import (
+    ConfluenceClient,
+    ConfluenceConflictError,
+    _cql_quote,
+)
+
+
+def _response(payload=None, status=200):
+    """Build a mock HTTP response with a JSON body."""
+    response = mock.Mock(status_code=status)
+    response.json.return_value = payload
+    if status >= 400:
+        response.raise_for_status.side_effect = requests.HTTPError(
+            f"{status} Error", response=response
+        )
+    return response
+
+
+def _page(version, page_id="42", title="Report"):
+    """Build a page API result."""
+    return {"id": page_id, "title": title, "version": {"number": version}}
+
+
+def _put_version(call):
+    """Get the version number sent by a page update request."""
+    return _json.loads(call.kwargs["data"])["version"]["number"]
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable replacement for time.monotonic() in the client module."""
+    now = SimpleNamespace(value=1000.0)
+    monkeypatch.setattr(
+        confluence_module, "time", SimpleNamespace(monotonic=lambda: now.value)
+    )
+    return now
+
+
+@pytest.fixture
+def client(clock):
+    """ConfluenceClient with a mocked HTTP session and clock."""
+    confluence_client = ConfluenceClient("https://confluence.example.com", "token")
+    confluence_client._session = mock.Mock()
+    return confluence_client
+
+
+def test_get_pages_by_titles_batches_cql(client):
+    """Test that titles are looked up with one quoted CQL search per 50 titles."""
+    titles = [f"Page {n}" for n in range(120)] + ['Say "hi"']
+    existing = ["Page 7", 'Say "hi"']
+
+    def search(url, params, timeout):
+        found = [title for title in existing if _cql_quote(title) in params["cql"]]
+        return _response({"results": [_page(1, title=title) for title in found]})
+
+    client._session.get.side_effect = search
+
+    pages = client.get_pages_by_titles("SPACE", titles)
+
+    assert sorted(pages) == ["Page 7", 'Say "hi"']
+    calls = client._session.get.call_args_list
+    assert [call.kwargs["params"]["limit"] for call in calls] == [50, 50, 21]
+    assert all(
+        call.args[0] == "https://confluence.example.com/rest/api/content/search"
+        for call in calls
+    )
+    assert calls[0].kwargs["params"]["cql"].startswith(
+        'space = "SPACE" and type = page and title in ("Page 0", "Page 1", '
+    )
+    assert calls[2].kwargs["params"]["cql"].endswith('"Page 119", "Say \\"hi\\"")')
+
+
+def test_create_or_update_page_uses_cache(client):
+    """Test that a second push of the same page skips the lookup request."""
+    client._session.get.return_value = _response({"results": [_page(1)]})
+    client._session.put.side_effect = [_response(_page(2)), _response(_page(3))]
+
+    client.create_or_update_page("SPACE", "Report", "<p>v2</p>")
+    client.create_or_update_page("SPACE", "Report", "<p>v3</p>")
+
+    client._session.get.assert_called_once()
+    assert [_put_version(call) for call in client._session.put.call_args_list] == [2, 3]
+
+
+def test_page_cache_expires(client, clock):
+    """Test that a cached page is looked up again once the TTL has passed."""
+    client._session.get.side_effect = [
+        _response({"results": [_page(1)]}),
+        _response({"results": [_page(5)]}),
+    ]
+    client._session.put.side_effect = [_response(_page(2)), _response(_page(6))]
+
+    client.create_or_update_page("SPACE", "Report", "<p>first</p>")
+    clock.value += client.page_cache_ttl
+    client.create_or_update_page("SPACE", "Report", "<p>second</p>")
+
+    assert client._session.get.call_count == 2
+    assert [_put_version(call) for call in client._session.put.call_args_list] == [2, 6]
+
+
+def test_conflict_invalidates_cache(client):
+    """Test that a 409 on update drops the cached version so the next push looks it up."""
+    client._session.get.side_effect = [
+        _response({"results": [_page(1)]}),
+        _response({"results": [_page(4)]}),
+    ]
+    client._session.put.side_effect = [
+        _response(_page(2)),
+        _response(status=409),
+        _response(_page(5)),
+    ]
+
+    client.create_or_update_page("SPACE", "Report", "<p>first</p>")
+    # Someone else updated the page, so the cached version 2 is stale
+    with pytest.raises(ConfluenceConflictError):
+        client.create_or_update_page("SPACE", "Report", "<p>second</p>")
+    client.create_or_update_page("SPACE", "Report", "<p>third</p>")
+
+    assert client._session.get.call_count == 2
+    assert [_put_version(call) for call in client._session.put.call_args_list] == [2, 3, 5]
@@ -1,12 +1,9 @@
 """Tests for DOCX formatter."""
 
-import tempfile
 from datetime import date
-from pathlib import Path
 
 import pytest
 
-from report_template.generator import ReportGenerator
 from report_template.models import (
     FeatureDevReport,
     OutputFormat,
@@ -56,12 +53,6 @@ def sample_report():
     )
 
 
-@pytest.fixture
-def generator():
-    """Create a ReportGenerator instance."""
-    return ReportGenerator()
-
-
 @pytest.mark.skipif(not DOCX_AVAILABLE, reason="python-docx not installed")
 def test_generate_docx(generator, sample_report):
     """Test generating a DOCX report."""
@@ -76,67 +67,64 @@ def test_generate_docx(generator, sample_report):
 
 
 @pytest.mark.skipif(not DOCX_AVAILABLE, reason="python-docx not installed")
-def test_generate_docx_to_file(generator, sample_report):
+def test_generate_docx_to_file(generator, sample_report, tmp_path):
     """Test generating a DOCX report to a file."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        output_path = Path(tmpdir) / "report.docx"
+    output_path = tmp_path / "report.docx"
 
-        result_path = generator.generate_to_file(
-            sample_report,
-            ReportType.FEATURE_DEV,
-            output_path
-        )
+    result_path = generator.generate_to_file(
+        sample_report,
+        ReportType.FEATURE_DEV,
+        output_path
+    )
 
-        assert result_path.exists()
-        assert result_path == output_path
-        assert result_path.stat().st_size > 0
+    assert result_path.exists()
+    assert result_path == output_path
+    assert result_path.stat().st_size > 0
 
-        # Verify it's a valid DOCX file
-        doc = docx.Document(str(result_path))
-        assert len(doc.paragraphs) > 0
+    # Verify it's a valid DOCX file
+    doc = docx.Document(str(result_path))
+    assert len(doc.paragraphs) > 0
 
-        # Check that title is in the document
-        text = "\n".join([p.text for p in doc.paragraphs])
-        assert "Test Report" in text
+    # Check that title is in the document
+    text = "\n".join([p.text for p in doc.paragraphs])
+    assert "Test Report" in text
 
 
 @pytest.mark.skipif(not DOCX_AVAILABLE, reason="python-docx not installed")
-def test_docx_format_auto_detection(generator, sample_report):
+def test_docx_format_auto_detection(generator, sample_report, tmp_path):
     """Test automatic DOCX format detection from file extension."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Test .docx extension
-        docx_path = Path(tmpdir) / "report.docx"
-        generator.generate_to_file(sample_report, ReportType.FEATURE_DEV, docx_path)
-        assert docx_path.exists()
+    # Test .docx extension
+    docx_path = tmp_path / "report.docx"
+    generator.generate_to_file(sample_report, ReportType.FEATURE_DEV, docx_path)
+    assert docx_path.exists()
 
-        # Test .doc extension (should also work)
-        doc_path = Path(tmpdir) / "report.doc"
-        generator.generate_to_file(sample_report, ReportType.FEATURE_DEV, doc_path)
-        assert doc_path.exists()
+    # Test .doc extension (should also work)
+    doc_path = tmp_path / "report.doc"
+    generator.generate_to_file(sample_report, ReportType.FEATURE_DEV, doc_path)
+    assert doc_path.exists()
 
 
 @pytest.mark.skipif(not DOCX_AVAILABLE, reason="python-docx not installed")
-def test_docx_contains_expected_sections(generator, sample_report):
+def test_docx_contains_expected_sections(generator, sample_report, tmp_path):
     """Test that DOCX contains expected report sections."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        output_path = Path(tmpdir) / "report.docx"
-        generator.generate_to_file(sample_report, ReportType.FEATURE_DEV, output_path)
-
-        # Read the document
-        doc = docx.Document(str(output_path))
-
-        # Extract all text
-        all_text = "\n".join([p.text for p in doc.paragraphs])
-
-        # Check for key sections
-        assert "Test Report" in all_text
-        assert "Test Project" in all_text
-        assert "Test Feature" in all_text
-        assert "Executive Summary" in all_text
-        assert "Team" in all_text
-        assert "Objectives" in all_text
-        assert "John Doe" in all_text
-        assert "Objective 1" in all_text
+    output_path = tmp_path / "report.docx"
+    generator.generate_to_file(sample_report, ReportType.FEATURE_DEV, output_path)
+
+    # Read the document
+    doc = docx.Document(str(output_path))
+
+    # Extract all text
+    all_text = "\n".join([p.text for p in doc.paragraphs])
+
+    # Check for key sections
+    assert "Test Report" in all_text
+    assert "Test Project" in all_text
+    assert "Test Feature" in all_text
+    assert "Executive Summary" in all_text
+    assert "Team" in all_text
+    assert "Objectives" in all_text
+    assert "John Doe" in all_text
+    assert "Objective 1" in all_text
 
 
 @pytest.mark.skipif(not DOCX_AVAILABLE, reason="python-docx not installed")
@@ -2,6 +2,7 @@
 
 import pytest
 
+from report_template.formatters.batch import create_reports_batch
 from report_template.formatters.html import render_html
 from report_template.formatters.markdown import dict_to_markdown_table, render_markdown
 
@@ -91,3 +92,22 @@ def hello():
     result = render_html(markdown_text, include_css=False)
 
     assert "<code>" in result or "<pre>" in result
+
+
+def test_create_reports_batch_docx():
+    """Test batch DOCX creation keeps the input order."""
+    items = [
+        ({"title": f"Report {i}", "project_name": "Test Project"}, "feature_dev")
+        for i in range(3)
+    ]
+
+    results = create_reports_batch(items, fmt="docx", workers=2)
+
+    assert len(results) == 3
+    assert all(content.startswith(b"PK") for content in results)
+
+
+def test_create_reports_batch_unsupported_format():
+    """Test batch creation rejects unknown formats."""
+    with pytest.raises(ValueError, match="Unsupported batch format"):
+        create_reports_batch([], fmt="odt")
@@ -1,10 +1,11 @@
 """Tests for report generator."""
 
-import tempfile from datetime import date
-from pathlib import Path
+from datetime import date
+from io import BytesIO
 
 import pytest
 
+from report_template import generator as generator_module
 from report_template.generator import ReportGenerator
 from report_template.models import (
     FeatureDevReport,
@@ -16,8 +17,12 @@ from report_template.models import (
     TeamMember,
 )
 
+# Report dates default to today
+_TODAY_ISO = date.today().isoformat()
+_YEAR = str(date.today().year)
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def sample_report():
     """Create a sample report for testing."""
     return FeatureDevReport(
@@ -48,12 +53,6 @@ def sample_report():
     )
 
 
-@pytest.fixture
-def generator():
-    """Create a ReportGenerator instance."""
-    return ReportGenerator()
-
-
 def test_generator_initialization():
     """Test ReportGenerator initialization."""
     gen = ReportGenerator()
@@ -61,35 +60,50 @@ def test_generator_initialization():
     assert gen.env is not None
 
 
-def test_generate_markdown(generator, sample_report):
-    """Test generating a markdown report."""
-    result = generator.generate(
-        sample_report,
-        ReportType.FEATURE_DEV,
-        OutputFormat.MARKDOWN
-    )
+def test_env_has_autoreload_off(generator):
+    """Test that templates are cached without per-lookup mtime checks or eviction."""
+    assert generator.env.auto_reload is False
+    # cache_size=-1 makes Jinja2 use a plain dict instead of a bounded LRU cache
+    assert type(generator.env.cache) is dict
 
-    assert isinstance(result, str)
-    assert "Test Report" in result
-    assert "Test Feature" in result
-    assert "Test Author" in result
-    assert "John Doe" in result
-    assert "Objective 1" in result
-    assert "Task 1" in result
 
+def test_bytecode_cache(tmp_path, sample_report):
+    """Test that compiled templates are written to the bytecode cache directory."""
+    cache_dir = tmp_path / "jinja"
+    gen = ReportGenerator(bytecode_cache_dir=cache_dir)
+
+    gen.generate(sample_report, ReportType.FEATURE_DEV)
+
+    assert list(cache_dir.glob("*.cache"))
 
-def test_generate_html(generator, sample_report):
-    """Test generating an HTML report."""
-    result = generator.generate(
-        sample_report,
-        ReportType.FEATURE_DEV,
-        OutputFormat.HTML
-    )
+
+def test_bytecode_cache_unusable_directory(tmp_path, sample_report):
+    """Test that an unusable cache directory falls back to compiling in memory."""
+    blocker = tmp_path / "not-a-directory"
+    blocker.write_text("")
+    gen = ReportGenerator(bytecode_cache_dir=blocker / "jinja")
+
+    assert gen.env.bytecode_cache is None
+    assert "Test Report" in gen.generate(sample_report, ReportType.FEATURE_DEV)
+
+
+GENERATE_CASES = [
+    (
+        OutputFormat.MARKDOWN,
+        ["Test Report", "Test Feature", "Test Author", "John Doe", "Objective 1", "Task 1"],
+    ),
+    (OutputFormat.HTML, ["<!DOCTYPE html>", "Test Report", "<h1>"]),
+]
+
+
+@pytest.mark.parametrize("output_format,expected", GENERATE_CASES)
+def test_generate(generator, sample_report, output_format, expected):
+    """Test generating a report in each text format."""
+    result = generator.generate(sample_report, ReportType.FEATURE_DEV, output_format)
 
     assert isinstance(result, str)
-    assert "<!DOCTYPE html>" in result
-    assert "Test Report" in result
-    assert "<table>" in result or "<h1>" in result
+    for text in expected:
+        assert text in result
 
 
 def test_generate_from_dict(generator):
@@ -112,53 +126,136 @@ def test_generate_from_dict(generator):
     assert "Dict Feature" in result
 
 
-def test_generate_to_file_markdown(generator, sample_report):
-    """Test generating a report to a markdown file."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        output_path = Path(tmpdir) / "report.md"
+GENERATE_TO_FILE_CASES = [
+    ("report.md", ["Test Report", "Test Feature"]),
+    ("report.html", ["<!DOCTYPE html>"]),
+]
 
-        result_path = generator.generate_to_file(
-            sample_report,
-            ReportType.FEATURE_DEV,
-            output_path
-        )
 
-        assert result_path.exists()
-        assert result_path == output_path
+@pytest.mark.parametrize("filename,expected", GENERATE_TO_FILE_CASES)
+def test_generate_to_file(generator, sample_report, filename, expected, tmp_path):
+    """Test generating a report to a file in each text format."""
+    output_path = tmp_path / filename
 
-        content = result_path.read_text()
-        assert "Test Report" in content
-        assert "Test Feature" in content
+    result_path = generator.generate_to_file(
+        sample_report,
+        ReportType.FEATURE_DEV,
+        output_path
+    )
+
+    assert result_path.exists()
+    assert result_path == output_path
 
+    content = result_path.read_text()
+    for text in expected:
+        assert text in content
 
-def test_generate_to_file_html(generator, sample_report):
-    """Test generating a report to an HTML file."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        output_path = Path(tmpdir) / "report.html"
 
-        result_path = generator.generate_to_file(
-            sample_report,
-            ReportType.FEATURE_DEV,
-            output_path
-        )
+def test_generate_stream(generator, sample_report):
+    """Test streaming a report into a binary file object."""
+    buffer = BytesIO()
 
-        assert result_path.exists()
-        content = result_path.read_text()
-        assert "<!DOCTYPE html>" in content or "<html" in content
+    generator.generate_stream(sample_report, ReportType.FEATURE_DEV, buffer)
 
+    expected = generator.generate(sample_report, ReportType.FEATURE_DEV)
+    assert buffer.getvalue().decode("utf-8") == expected
 
-def test_format_auto_detection(generator, sample_report):
+
+def test_format_auto_detection(generator, sample_report, tmp_path):
     """Test automatic format detection from file extension."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Test .md extension
-        md_path = Path(tmpdir) / "report.md"
-        generator.generate_to_file(sample_report, ReportType.FEATURE_DEV, md_path)
-        assert md_path.exists()
+    # Test .md extension
+    md_path = tmp_path / "report.md"
+    generator.generate_to_file(sample_report, ReportType.FEATURE_DEV, md_path)
+    assert md_path.exists()
+
+    # Test .html extension
+    html_path = tmp_path / "report.html"
+    generator.generate_to_file(sample_report, ReportType.FEATURE_DEV, html_path)
+    assert html_path.exists()
 
-        # Test .html extension
-        html_path = Path(tmpdir) / "report.html"
-        generator.generate_to_file(sample_report, ReportType.FEATURE_DEV, html_path)
-        assert html_path.exists()
+
+def test_generate_to_file_skip_unchanged(generator, sample_report, tmp_path):
+    """Test that unchanged inputs skip regeneration."""
+    output_path = tmp_path / "report.md"
+
+    generator.generate_to_file(
+        sample_report, ReportType.FEATURE_DEV, output_path, skip_unchanged=True
+    )
+    assert output_path.with_suffix(".md.cachekey").exists()
+
+    # Same inputs: the existing file is left untouched
+    output_path.write_text("stale")
+    generator.generate_to_file(
+        sample_report, ReportType.FEATURE_DEV, output_path, skip_unchanged=True
+    )
+    assert output_path.read_text() == "stale"
+
+    # Changed inputs: the report is regenerated
+    changed = sample_report.model_copy(update={"title": "Changed Report"})
+    generator.generate_to_file(
+        changed, ReportType.FEATURE_DEV, output_path, skip_unchanged=True
+    )
+    assert "Changed Report" in output_path.read_text()
+
+
+def test_generate_all(generator, sample_report, tmp_path):
+    """Test generating several output files from one report."""
+    md_path = tmp_path / "report.md"
+    html_path = tmp_path / "report.html"
+
+    paths = generator.generate_all(
+        sample_report,
+        [(ReportType.FEATURE_DEV, md_path), (ReportType.FEATURE_DEV, html_path)],
+    )
+
+    assert paths == [md_path, html_path]
+    assert md_path.read_text() == generator.generate(
+        sample_report, ReportType.FEATURE_DEV, OutputFormat.MARKDOWN
+    )
+    assert "<!DOCTYPE html>" in html_path.read_text()
+
+
+def test_generate_many(generator, sample_report):
+    """Test rendering several reports with the same template."""
+    other = sample_report.model_copy(update={"title": "Other Report"})
+
+    results = list(generator.generate_many([sample_report, other], ReportType.FEATURE_DEV))
+
+    assert results == [
+        generator.generate(sample_report, ReportType.FEATURE_DEV),
+        generator.generate(other, ReportType.FEATURE_DEV),
+    ]
+    assert "Other Report" in results[1]
+
+
+def test_generate_to_file_background_writes(sample_report, tmp_path):
+    """Test that background writes land on disk after join()."""
+    gen = ReportGenerator(background_writes=True)
+    output_path = tmp_path / "report.md"
+
+    result = gen.generate_to_file(sample_report, ReportType.FEATURE_DEV, output_path)
+    gen.join()
+
+    assert result == output_path
+    assert output_path.read_text() == gen.generate(
+        sample_report, ReportType.FEATURE_DEV, OutputFormat.MARKDOWN
+    )
+
+    gen.generate_to_file(
+        sample_report, ReportType.FEATURE_DEV, tmp_path / "missing" / "report.md"
+    )
+    with pytest.raises(FileNotFoundError):
+        gen.join()
+
+
+def test_shutdown_pdf_pool():
+    """Test that the PDF worker pool can be shut down and is recreated on demand."""
+    pool = generator_module._get_pdf_pool()
+    generator_module.shutdown_pdf_pool()
+
+    assert generator_module._PDF_POOL is None
+    assert generator_module._get_pdf_pool() is not pool
+    generator_module.shutdown_pdf_pool()
 
 
 def test_custom_filters():
@@ -170,6 +267,17 @@ def test_custom_filters():
     assert 'custom_upper' in gen.env.filters
 
 
+def test_environment_shared_without_custom_filters():
+    """Test generators share a Jinja2 environment unless they add filters."""
+    gen1 = ReportGenerator()
+    gen2 = ReportGenerator()
+    gen3 = ReportGenerator(custom_filters={'custom_upper': str.upper})
+
+    assert gen1.env is gen2.env
+    assert gen3.env is not gen1.env
+    assert 'custom_upper' not in gen1.env.filters
+
+
 def test_list_templates(generator):
     """Test listing available templates."""
     templates = generator.list_templates()
@@ -209,8 +317,7 @@ def test_date_filter(generator, sample_report):
     )
 
     # Should contain a formatted date
-    today = date.today().strftime("%Y-%m-%d")
-    assert today in result or str(date.today().year) in result
+    assert _TODAY_ISO in result or _YEAR in result
 
 
 def test_generate_with_custom_template_name(generator, sample_report):
@@ -0,0 +1,144 @@
+"""Tests for the JIRA client, with the HTTP session mocked."""
+
+import re
+from unittest import mock
+
+import pytest
+import requests
+
+from report_template.jira_client import JiraClient, JiraError
+
+
+def _issue(key, summary="Summary"):
+    """Build a search/issue API result for an issue."""
+    return {
+        "key": key,
+        "fields": {
+            "summary": f"{summary} {key}",
+            "status": {"name": "In Progress"},
+            "priority": {"name": "High"},
+            "created": "2024-01-15T10:00:00.000+0000",
+        },
+    }
+
+
+def _response(payload=None, status=200):
+    """Build a mock HTTP response with a JSON body."""
+    response = mock.Mock(status_code=status)
+    response.json.return_value = payload
+    if status >= 400:
+        response.raise_for_status.side_effect = requests.HTTPError(
+            f"{status} Error", response=response
+        )
+    return response
+
+
+def _searched_keys(call):
+    """Get the issue keys of a search request from its JQL."""
+    return re.findall(r'"([^"]+)"', call.kwargs["json"]["jql"])
+
+
+def _search_returning(existing_keys):
+    """Mock search endpoint that returns the requested issues that exist."""
+    def post(url, json, timeout):
+        keys = re.findall(r'"([^"]+)"', json["jql"])
+        # The search API doesn't return issues in the order requested
+        issues = [_issue(key) for key in reversed(keys) if key in existing_keys]
+        return _response({"issues": issues})
+    return post
+
+
+def _get_issue_returning(existing_keys):
+    """Mock single-issue endpoint that returns 404 for issues that don't exist."""
+    def get(url, timeout):
+        key = re.search(r"/issue/([^?]+)", url).group(1)
+        return _response(_issue(key)) if key in existing_keys else _response(status=404)
+    return get
+
+
+@pytest.fixture
+def client():
+    """JiraClient with a mocked HTTP session."""
+    jira_client = JiraClient("https://jira.example.com/", "token")
+    jira_client._session = mock.Mock()
+    return jira_client
+
+
+def test_get_issues_bulk_skips_missing_keys(client):
+    """Test that issues are keyed by issue key and missing keys are left out."""
+    client._session.post.side_effect = _search_returning({"PROJ-1", "PROJ-3"})
+
+    issues = client.get_issues_bulk(["PROJ-1", "PROJ-2", "PROJ-3"])
+
+    assert sorted(issues) == ["PROJ-1", "PROJ-3"]
+    assert issues["PROJ-3"]["fields"]["summary"] == "Summary PROJ-3"
+    client._session.post.assert_called_once()
+    assert _searched_keys(client._session.post.call_args) == ["PROJ-1", "PROJ-2", "PROJ-3"]
+
+
+def test_get_issues_bulk_quotes_keys(client):
+    """Test that keys are quoted in the JQL so they can't change the query."""
+    client._session.post.return_value = _response({"issues": []})
+
+    client.get_issues_bulk(['PROJ-1', 'X") OR project = "SECRET'])
+
+    jql = client._session.post.call_args.kwargs["json"]["jql"]
+    assert jql == 'key in ("PROJ-1", "X\\") OR project = \\"SECRET")'
+
+
+def test_get_issues_bulk_chunks_searches(client):
+    """Test that more than 100 keys are split into concurrent searches of up to 100."""
+    keys = [f"PROJ-{n}" for n in range(250)]
+    client._session.post.side_effect = _search_returning(set(keys))
+
+    issues = client.get_issues_bulk(keys, max_workers=3)
+
+    assert sorted(issues) == sorted(keys)
+    searched = [_searched_keys(call) for call in client._session.post.call_args_list]
+    assert sorted(len(chunk) for chunk in searched) == [50, 100, 100]
+    assert sorted(key for chunk in searched for key in chunk) == sorted(keys)
+
+
+def test_get_issues_bulk_raises_jira_error(client):
+    """Test that a failed search raises JiraError."""
+    client._session.post.return_value = _response(status=500)
+
+    with pytest.raises(JiraError):
+        client.get_issues_bulk(["PROJ-1"])
+
+
+def test_sync_tasks_uses_bulk_search(client):
+    """Test that sync_tasks merges the searched issues into the tasks, in order."""
+    client._session.post.side_effect = _search_returning({"PROJ-1", "PROJ-2"})
+    tasks = [{"jira_id": "PROJ-2"}, {"title": "Local task"}, {"jira_id": "PROJ-1"}]
+
+    updated = client.sync_tasks(tasks)
+
+    assert [task.get("title") for task in updated] == [
+        "Summary PROJ-2", "Local task", "Summary PROJ-1"
+    ]
+    client._session.get.assert_not_called()
+
+
+def test_sync_tasks_falls_back_to_single_issues(client):
+    """Test that issues are fetched one by one when the bulk search fails."""
+    client._session.post.side_effect = requests.ConnectionError("search unavailable")
+    client._session.get.side_effect = _get_issue_returning({"PROJ-1", "PROJ-3"})
+    tasks = [{"jira_id": "PROJ-1"}, {"jira_id": "PROJ-2", "title": "Kept"}, {"jira_id": "PROJ-3"}]
+
+    updated = client.sync_tasks(tasks)
+
+    assert [task["title"] for task in updated] == ["Summary PROJ-1", "Kept", "Summary PROJ-3"]
+    assert client._session.get.call_count == 3
+
+
+def test_sync_tasks_fetches_keys_missing_from_search(client):
+    """Test that issues the search didn't return are fetched individually."""
+    client._session.post.side_effect = _search_returning({"PROJ-1"})
+    client._session.get.return_value = _response(_issue("PROJ-2"))
+
+    updated = client.sync_tasks([{"jira_id": "PROJ-1"}, {"jira_id": "PROJ-2"}])
+
+    assert [task["title"] for task in updated] == ["Summary PROJ-1", "Summary PROJ-2"]
+    client._session.get.assert_called_once()
+    assert "/issue/PROJ-2" in client._session.get.call_args.args[0]